@@ -24,10 +24,12 @@ if __name__ == "__main__":
         # Load all sounds
         sounds = []
         for wav_path in wav_paths:
-            if not Path(wav_path).exists():
+            try:
+                raw = Path(wav_path).read_bytes()
+            except FileNotFoundError:
                 print(f"Warning: File not found: {wav_path}, skipping")
                 continue
-            sound = engine.load(wav_path)
+            sound = engine.load_wav_bytes(raw, wav_path)
             sounds.append(sound)
             print(f"Loaded: {wav_path} ({sound.duration:.2f}s)")
 
@@ -1,7 +1,6 @@
 """Example: Play an MP3 file."""
 
 import sys
-import time
 from pathlib import Path
 
 from xaudio2py import AudioEngine
@@ -38,13 +37,11 @@ if __name__ == "__main__":
         print("Playing...")
         handle = engine.play(sound)
 
-        # Give XAudio2 a moment to initialize playback
-        time.sleep(0.05)
-
         # Wait for playback to complete (or interrupt)
         try:
-            while engine.is_playing(handle):
-                time.sleep(0.1)
+            # Wait with a timeout so Ctrl+C is still delivered on Windows
+            while not engine.wait(handle, timeout=0.5):
+                pass
             print("Playback completed")
         except KeyboardInterrupt:
             print("\nInterrupted, stopping...")
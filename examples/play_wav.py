@@ -1,7 +1,6 @@
 """Example: Play a WAV file."""
 
 import sys
-import time
 from pathlib import Path
 
 from xaudio2py import AudioEngine
@@ -31,14 +30,12 @@ if __name__ == "__main__":
         # Play sound
         print("Playing...")
         handle = engine.play(sound)
-        
-        # Give XAudio2 a moment to initialize playback
-        time.sleep(0.05)
 
         # Wait for playback to complete (or interrupt)
         try:
-            while engine.is_playing(handle):
-                time.sleep(0.1)
+            # Wait with a timeout so Ctrl+C is still delivered on Windows
+            while not engine.wait(handle, timeout=0.5):
+                pass
             print("Playback completed")
         except KeyboardInterrupt:
             print("\nInterrupted, stopping...")
@@ -6,8 +6,8 @@ using XAudio2, with support for WAV files, multiple simultaneous playbacks,
 volume control, panning, and looping.
 """
 
-from xaudio2py.api.engine import AudioEngine
-from xaudio2py.api.sound import Sound, PlaybackHandle
+import importlib
+
 from xaudio2py.core.models import EngineConfig, PlaybackState
 from xaudio2py.core.exceptions import (
     # New exception names
@@ -25,6 +25,28 @@ from xaudio2py.core.exceptions import (
 
 __version__ = "0.2.0"
 
+# The API classes pull in the engine, services and format registry, so they
+# are imported on first access (PEP 562) rather than with the package
+_LAZY_EXPORTS = {
+    "AudioEngine": "xaudio2py.api.engine",
+    "Sound": "xaudio2py.api.sound",
+    "PlaybackHandle": "xaudio2py.api.sound",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 __all__ = [
     "AudioEngine",
     "Sound",
@@ -1,17 +1,42 @@
 """AudioEngine - main public API facade."""
 
-from typing import Optional
+from typing import ContextManager, Optional
 from xaudio2py.api.sound import PlaybackHandle, Sound
 from xaudio2py.core.exceptions import EngineNotStartedError
 from xaudio2py.core.interfaces import IAudioBackend
 from xaudio2py.core.models import EngineConfig
 from xaudio2py.formats import load_audio
+from xaudio2py.formats.wav import wav_format
 from xaudio2py.services.engine_lifecycle import EngineLifecycleService
 from xaudio2py.services.playback import PlaybackService
 from xaudio2py.utils.log import get_logger
 
 logger = get_logger(__name__)
 
+_DEFAULT_CONFIG = EngineConfig()
+
+
+def _raise_not_started():
+    """Raise EngineNotStartedError; used as `service or _raise_not_started()`."""
+    raise EngineNotStartedError("Engine not started")
+
+
+# AudioEngine methods that are rebound straight to PlaybackService on start().
+# The class-level definitions only run while the engine is not started, so
+# each target must take exactly the same arguments as its facade method.
+_PLAYBACK_METHODS = {
+    "play": "start_playback",
+    "stop": "stop_playback",
+    "pause": "pause_playback",
+    "resume": "resume_playback",
+    "set_volume": "set_volume",
+    "ramp_volume": "ramp_volume",
+    "set_pan": "set_pan",
+    "batch": "batch",
+    "is_playing": "is_playing",
+    "wait": "wait",
+}
+
 
 class AudioEngine:
     """
@@ -35,16 +60,18 @@ class AudioEngine:
 
     def __init__(
         self,
-        config: EngineConfig = EngineConfig(),
+        config: Optional[EngineConfig] = None,
         backend: Optional[IAudioBackend] = None,
     ):
         """
         Initialize AudioEngine.
 
         Args:
-            config: Engine configuration.
+            config: Engine configuration (default: EngineConfig()).
             backend: Optional backend implementation (default: XAudio2Backend).
         """
+        if config is None:
+            config = _DEFAULT_CONFIG
         self._config = config
         
         # Initialize backend if not provided
@@ -71,6 +98,11 @@ class AudioEngine:
         backend = self._lifecycle_service.backend
         self._playback_service = PlaybackService(worker, backend)
         
+        # Bind playback methods directly to the service so the hot path
+        # skips the "engine started" check and one delegating call.
+        for name, target in _PLAYBACK_METHODS.items():
+            setattr(self, name, getattr(self._playback_service, target))
+        
         logger.info("AudioEngine started")
 
     def shutdown(self) -> None:
@@ -84,12 +116,16 @@ class AudioEngine:
             try:
                 self._playback_service.stop_all()
             except Exception as e:
-                logger.warning(f"Error stopping all playbacks during shutdown: {e}")
+                logger.warning("Error stopping all playbacks during shutdown: %s", e)
         
         # Shutdown lifecycle service
         self._lifecycle_service.shutdown()
         self._playback_service = None
         
+        # Restore class-level methods, which raise EngineNotStartedError
+        for name in _PLAYBACK_METHODS:
+            self.__dict__.pop(name, None)
+        
         logger.info("AudioEngine shut down")
 
     def load(self, path: str) -> Sound:
@@ -113,6 +149,25 @@ class AudioEngine:
         data = load_audio(path)
         return Sound(data, path)
 
+    def load_wav_bytes(self, raw: bytes, name: str = "") -> Sound:
+        """
+        Load a WAV file that has already been read into memory.
+
+        Useful when the caller reads files itself (e.g. from an archive or
+        while batch-loading sound effects) and wants to avoid a second open.
+
+        Args:
+            raw: Complete WAV file contents.
+            name: Name or path reported by Sound.path.
+
+        Returns:
+            Sound object.
+
+        Raises:
+            InvalidAudioFormat: If format is not supported.
+        """
+        return Sound(wav_format.load_bytes(raw), name)
+
     def play(
         self,
         sound: Sound,
@@ -136,10 +191,9 @@ class AudioEngine:
         Raises:
             EngineNotStartedError: If engine is not started.
         """
-        if self._playback_service is None:
-            raise EngineNotStartedError("Engine must be started before playing sounds")
-        
-        return self._playback_service.start_playback(sound, volume=volume, pan=pan, loop=loop)
+        return (self._playback_service or _raise_not_started()).start_playback(
+            sound, volume=volume, pan=pan, loop=loop
+        )
 
     def stop(self, handle: PlaybackHandle) -> None:
         """
@@ -152,10 +206,7 @@ class AudioEngine:
             EngineNotStartedError: If engine is not started.
             PlaybackNotFoundError: If handle is invalid.
         """
-        if self._playback_service is None:
-            raise EngineNotStartedError("Engine not started")
-        
-        self._playback_service.stop_playback(handle)
+        (self._playback_service or _raise_not_started()).stop_playback(handle)
 
     def pause(self, handle: PlaybackHandle) -> None:
         """
@@ -168,10 +219,7 @@ class AudioEngine:
             EngineNotStartedError: If engine is not started.
             PlaybackNotFoundError: If handle is invalid.
         """
-        if self._playback_service is None:
-            raise EngineNotStartedError("Engine not started")
-        
-        self._playback_service.pause_playback(handle)
+        (self._playback_service or _raise_not_started()).pause_playback(handle)
 
     def resume(self, handle: PlaybackHandle) -> None:
         """
@@ -184,10 +232,7 @@ class AudioEngine:
             EngineNotStartedError: If engine is not started.
             PlaybackNotFoundError: If handle is invalid.
         """
-        if self._playback_service is None:
-            raise EngineNotStartedError("Engine not started")
-        
-        self._playback_service.resume_playback(handle)
+        (self._playback_service or _raise_not_started()).resume_playback(handle)
 
     def set_volume(self, handle: PlaybackHandle, volume: float) -> None:
         """
@@ -201,10 +246,22 @@ class AudioEngine:
             EngineNotStartedError: If engine is not started.
             PlaybackNotFoundError: If handle is invalid.
         """
-        if self._playback_service is None:
-            raise EngineNotStartedError("Engine not started")
-        
-        self._playback_service.set_volume(handle, volume)
+        (self._playback_service or _raise_not_started()).set_volume(handle, volume)
+
+    def ramp_volume(self, handle: PlaybackHandle, target: float, duration: float) -> None:
+        """
+        Fade volume of a playback linearly to target over duration seconds.
+
+        Args:
+            handle: Playback handle.
+            target: Target volume (0.0 to 1.0).
+            duration: Ramp duration in seconds.
+
+        Raises:
+            EngineNotStartedError: If engine is not started.
+            PlaybackNotFoundError: If handle is invalid.
+        """
+        (self._playback_service or _raise_not_started()).ramp_volume(handle, target, duration)
 
     def set_pan(self, handle: PlaybackHandle, pan: float) -> None:
         """
@@ -218,10 +275,24 @@ class AudioEngine:
             EngineNotStartedError: If engine is not started.
             PlaybackNotFoundError: If handle is invalid.
         """
-        if self._playback_service is None:
-            raise EngineNotStartedError("Engine not started")
-        
-        self._playback_service.set_pan(handle, pan)
+        (self._playback_service or _raise_not_started()).set_pan(handle, pan)
+
+    def batch(self) -> ContextManager[None]:
+        """
+        Apply set_volume/set_pan calls made inside the block together.
+
+        The changes take effect in one audio processing pass when the block
+        exits, e.g. to cross-fade two playbacks without an audible step.
+
+        Example:
+            with engine.batch():
+                engine.set_volume(music, 0.0)
+                engine.set_volume(ambient, 1.0)
+
+        Raises:
+            EngineNotStartedError: If engine is not started.
+        """
+        return (self._playback_service or _raise_not_started()).batch()
 
     def set_master_volume(self, volume: float) -> None:
         """
@@ -234,14 +305,14 @@ class AudioEngine:
             EngineNotStartedError: If engine is not started.
         """
         if not self._lifecycle_service.is_started:
-            raise EngineNotStartedError("Engine not started")
+            _raise_not_started()
         
         from xaudio2py.utils.validate import validate_volume
         volume = validate_volume(volume)
         
         worker = self._lifecycle_service.worker
         backend = self._lifecycle_service.backend
-        worker.execute(lambda: backend.set_master_volume(volume))
+        worker.execute(backend.set_master_volume, volume)
 
     def is_playing(self, handle: PlaybackHandle) -> bool:
         """
@@ -256,10 +327,25 @@ class AudioEngine:
         Raises:
             EngineNotStartedError: If engine is not started.
         """
-        if self._playback_service is None:
-            raise EngineNotStartedError("Engine not started")
-        
-        return self._playback_service.is_playing(handle)
+        return (self._playback_service or _raise_not_started()).is_playing(handle)
+
+    def wait(self, handle: PlaybackHandle, timeout: Optional[float] = None) -> bool:
+        """
+        Block until playback finishes or is stopped.
+
+        Looping playbacks only finish when stopped from another thread.
+
+        Args:
+            handle: Playback handle.
+            timeout: Maximum time to wait in seconds (None waits forever).
+
+        Returns:
+            True if playback finished, False if the timeout expired.
+
+        Raises:
+            EngineNotStartedError: If engine is not started.
+        """
+        return (self._playback_service or _raise_not_started()).wait(handle, timeout)
 
     def __enter__(self):
         """Context manager entry."""
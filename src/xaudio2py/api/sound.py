@@ -1,15 +1,14 @@
 """Sound and PlaybackHandle classes."""
 
-import uuid
 from dataclasses import dataclass
 from xaudio2py.core.models import SoundData, PlaybackState
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlaybackHandle:
     """Handle for a playback instance."""
 
-    id: str
+    id: int
     """Unique identifier for this playback."""
 
     def __str__(self) -> str:
@@ -17,7 +16,15 @@ class PlaybackHandle:
 
 
 class Sound:
-    """Represents a loaded audio file."""
+    """
+    Represents a loaded audio file.
+
+    Large WAV files (and cached MP3s) are memory-mapped rather than read into
+    memory; see SoundData.data. Call close() once the sound is no longer
+    played to release the mapping (and the file lock on Windows) early.
+    """
+
+    __slots__ = ("_data", "_path", "duration")
 
     def __init__(self, data: SoundData, path: str):
         """
@@ -29,6 +36,8 @@ class Sound:
         """
         self._data = data
         self._path = path
+        # Duration in seconds; a plain attribute since it is read on hot paths
+        self.duration: float = float(data.duration_seconds)
 
     @property
     def data(self) -> SoundData:
@@ -40,8 +49,12 @@ class Sound:
         """Get source file path."""
         return self._path
 
-    @property
-    def duration(self) -> float:
-        """Get duration in seconds."""
-        return self._data.duration_seconds
+    def close(self) -> None:
+        """
+        Release memory-mapped audio data (no-op for in-memory data).
+
+        The sound cannot be played afterwards. Playbacks that are still
+        running keep the mapping alive until they are stopped.
+        """
+        self._data.close()
 
@@ -1,7 +1,8 @@
 """Null backend for testing (no actual audio output)."""
 
+import threading
 import time
-from typing import Dict
+from typing import List, Optional
 from xaudio2py.core.interfaces import IAudioBackend, IVoice
 from xaudio2py.core.models import AudioFormat, PlaybackState, SoundData, VoiceParams
 from xaudio2py.utils.log import get_logger
@@ -12,81 +13,155 @@ logger = get_logger(__name__)
 class NullVoice(IVoice):
     """Null voice implementation for testing."""
 
-    def __init__(self, voice_id: str, format: AudioFormat, data: bytes, params: VoiceParams):
+    __slots__ = (
+        "voice_id",
+        "format",
+        "data",
+        "params",
+        "_state",
+        "_duration_ns",
+        "_start_time_ns",
+        "_total_played_ns",
+        "_finished",
+        "_operation_set",
+    )
+
+    def __init__(self, voice_id: int, format: AudioFormat, data: bytes, params: VoiceParams):
         self.voice_id = voice_id
         self.format = format
         self.data = data
         self.params = params
         self._state = PlaybackState.STOPPED
-        self._start_time: float = 0.0
-        self._paused_time: float = 0.0
-        self._total_played: float = 0.0
+        # Integer nanoseconds (time.monotonic_ns) to avoid float drift
+        self._duration_ns = len(data) * 1_000_000_000 // (format.sample_rate * format.frame_size)
+        self._start_time_ns = 0
+        self._total_played_ns = 0
+        self._finished = threading.Event()
+        self._operation_set = 0
+
+    @property
+    def name(self) -> str:
+        """Display name ("null_<id>"), formatted only when requested."""
+        return f"null_{self.voice_id}"
+
+    def __repr__(self) -> str:
+        return f"<NullVoice {self.name} {self._state.name}>"
 
     def start(self) -> None:
         """Start playback."""
-        if self._state == PlaybackState.PAUSED:
+        if self._state is PlaybackState.PAUSED:
             # Resume from pause
-            self._start_time = time.monotonic() - self._total_played
+            self._start_time_ns = time.monotonic_ns() - self._total_played_ns
         else:
-            self._start_time = time.monotonic()
-            self._total_played = 0.0
+            self._start_time_ns = time.monotonic_ns()
+            self._total_played_ns = 0
+        self._finished.clear()
         self._state = PlaybackState.PLAYING
-        logger.debug(f"NullVoice {self.voice_id}: started")
+        logger.debug("NullVoice %d: started", self.voice_id)
 
     def stop(self) -> None:
         """Stop playback."""
-        if self._state == PlaybackState.PLAYING:
-            self._total_played = time.monotonic() - self._start_time
+        if self._state is PlaybackState.PLAYING:
+            self._total_played_ns = time.monotonic_ns() - self._start_time_ns
         self._state = PlaybackState.STOPPED
-        logger.debug(f"NullVoice {self.voice_id}: stopped")
+        self._finished.set()
+        logger.debug("NullVoice %d: stopped", self.voice_id)
 
     def pause(self) -> None:
         """Pause playback."""
-        if self._state == PlaybackState.PLAYING:
-            self._total_played = time.monotonic() - self._start_time
+        if self._state is PlaybackState.PLAYING:
+            self._total_played_ns = time.monotonic_ns() - self._start_time_ns
             self._state = PlaybackState.PAUSED
-            logger.debug(f"NullVoice {self.voice_id}: paused")
+            logger.debug("NullVoice %d: paused", self.voice_id)
 
     def resume(self) -> None:
         """Resume playback."""
-        if self._state == PlaybackState.PAUSED:
-            self._start_time = time.monotonic() - self._total_played
+        if self._state is PlaybackState.PAUSED:
+            self._start_time_ns = time.monotonic_ns() - self._total_played_ns
             self._state = PlaybackState.PLAYING
-            logger.debug(f"NullVoice {self.voice_id}: resumed")
+            logger.debug("NullVoice %d: resumed", self.voice_id)
 
     def set_volume(self, volume: float) -> None:
         """Set volume."""
         self.params.volume = volume
-        logger.debug(f"NullVoice {self.voice_id}: volume={volume}")
+        logger.debug("NullVoice %d: volume=%s", self.voice_id, volume)
 
     def set_pan(self, pan: float) -> None:
         """Set pan."""
         self.params.pan = pan
-        logger.debug(f"NullVoice {self.voice_id}: pan={pan}")
+        logger.debug("NullVoice %d: pan=%s", self.voice_id, pan)
+
+    def begin_batch(self, operation_set: int) -> None:
+        """Begin a batch (changes still apply immediately)."""
+        self._operation_set = operation_set
+
+    def end_batch(self) -> None:
+        """End the current batch."""
+        logger.debug("NullVoice %d: committed operation set %d", self.voice_id, self._operation_set)
+        self._operation_set = 0
 
     def get_state(self) -> PlaybackState:
         """Get playback state."""
-        if self._state == PlaybackState.PLAYING:
-            # Simulate playback completion if not looping
-            if not self.params.loop:
-                duration = len(self.data) / (self.format.sample_rate * self.format.frame_size)
-                elapsed = time.monotonic() - self._start_time
-                if elapsed >= duration:
-                    self._state = PlaybackState.STOPPED
+        if self._state is PlaybackState.PLAYING and not self.params.loop:
+            # Simulate playback completion
+            if time.monotonic_ns() - self._start_time_ns >= self._duration_ns:
+                self._total_played_ns = self._duration_ns
+                self._state = PlaybackState.STOPPED
         return self._state
 
+    @property
+    def state(self) -> PlaybackState:
+        """Get playback state without mutating the voice (safe from any thread)."""
+        state = self._state
+        if (
+            state is PlaybackState.PLAYING
+            and not self.params.loop
+            and time.monotonic_ns() - self._start_time_ns >= self._duration_ns
+        ):
+            return PlaybackState.STOPPED
+        return state
+
+    def get_progress(self) -> tuple[int, int]:
+        """Get simulated (samples_played, buffers_queued)."""
+        state = self.get_state()
+        if state is PlaybackState.PLAYING:
+            elapsed_ns = time.monotonic_ns() - self._start_time_ns
+        else:
+            elapsed_ns = self._total_played_ns
+        samples_played = elapsed_ns * self.format.sample_rate // 1_000_000_000
+        buffers_queued = 0 if state is PlaybackState.STOPPED else 1
+        return samples_played, buffers_queued
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for simulated playback to finish or for stop()."""
+        deadline_ns = None if timeout is None else time.monotonic_ns() + int(timeout * 1e9)
+        while self.get_state() is not PlaybackState.STOPPED:
+            now_ns = time.monotonic_ns()
+            remaining_ns = None
+            if self._state is PlaybackState.PLAYING and not self.params.loop:
+                remaining_ns = self._duration_ns - (now_ns - self._start_time_ns)
+            if deadline_ns is not None:
+                left_ns = deadline_ns - now_ns
+                if left_ns <= 0:
+                    return False
+                remaining_ns = left_ns if remaining_ns is None else min(remaining_ns, left_ns)
+            self._finished.wait(None if remaining_ns is None else remaining_ns / 1e9)
+        return True
+
     def destroy(self) -> None:
         """Destroy voice."""
-        logger.debug(f"NullVoice {self.voice_id}: destroyed")
+        logger.debug("NullVoice %d: destroyed", self.voice_id)
 
 
 class NullBackend(IAudioBackend):
     """Null backend implementation for testing."""
 
+    __slots__ = ("_initialized", "_master_volume", "_voices", "_next_voice_id")
+
     def __init__(self):
         self._initialized = False
         self._master_volume = 1.0
-        self._voices: Dict[str, NullVoice] = {}
+        self._voices: List[NullVoice] = []
         self._next_voice_id = 0
 
     def initialize(self) -> None:
@@ -100,22 +175,22 @@ class NullBackend(IAudioBackend):
         self, format: AudioFormat, data: bytes, params: VoiceParams
     ) -> IVoice:
         """Create a source voice."""
-        voice_id = f"null_{self._next_voice_id}"
+        voice_id = self._next_voice_id
         self._next_voice_id += 1
         voice = NullVoice(voice_id, format, data, params)
-        self._voices[voice_id] = voice
+        self._voices.append(voice)
         voice.start()  # Start playback immediately, like XAudio2Backend does
-        logger.debug(f"Created NullVoice {voice_id}")
+        logger.debug("Created NullVoice %d", voice_id)
         return voice
 
     def set_master_volume(self, volume: float) -> None:
         """Set master volume."""
         self._master_volume = volume
-        logger.debug(f"NullBackend: master_volume={volume}")
+        logger.debug("NullBackend: master_volume=%s", volume)
 
     def shutdown(self) -> None:
         """Shutdown backend."""
-        for voice in self._voices.values():
+        for voice in self._voices:
             voice.destroy()
         self._voices.clear()
         self._initialized = False
@@ -1,10 +1,12 @@
 """XAudio2 backend implementation."""
 
 import ctypes
-from ctypes import POINTER, c_void_p, c_uint32, c_float, byref, cast, pointer, CFUNCTYPE
+import logging
+from ctypes import POINTER, c_void_p, c_uint32, c_float, byref, cast, pointer, WINFUNCTYPE
 from typing import Dict, Optional
 from xaudio2py.backends.xaudio2.bindings import (
     create_waveformatex,
+    WAVEFORMATEX,
     XAUDIO2_BUFFER,
     XAUDIO2_END_OF_STREAM,
     XAUDIO2_LOOP_INFINITE,
@@ -14,23 +16,67 @@ from xaudio2py.backends.xaudio2.com import COMInitializer, COINIT_MULTITHREADED
 from xaudio2py.backends.xaudio2.dll import get_XAudio2Create
 from xaudio2py.backends.xaudio2.interfaces import IXAudio2, IXAudio2Vtbl
 from xaudio2py.backends.xaudio2.utils import hrcheck
-from xaudio2py.backends.xaudio2.voices import SourceVoice, MasteringVoice
+from xaudio2py.backends.xaudio2.voices import SourceVoice, MasteringVoice, VoiceCallback
 from xaudio2py.core.interfaces import IAudioBackend, IVoice
 from xaudio2py.core.models import AudioFormat, VoiceParams
 from xaudio2py.utils.log import get_logger
 
 logger = get_logger(__name__)
 
+# IXAudio2 vtable method prototypes, built once instead of on every call
+_START_ENGINE_PROTO = WINFUNCTYPE(c_uint32, c_void_p)
+_RELEASE_PROTO = WINFUNCTYPE(c_uint32, c_void_p)
+_COMMIT_CHANGES_PROTO = WINFUNCTYPE(c_uint32, c_void_p, c_uint32)  # OperationSet
+_CREATE_MASTERING_VOICE_PROTO = WINFUNCTYPE(
+    c_uint32,
+    c_void_p,  # this
+    POINTER(c_void_p),  # ppMasteringVoice
+    c_uint32,  # InputChannels
+    c_uint32,  # InputSampleRate
+    c_uint32,  # Flags
+    c_void_p,  # szDeviceId
+    c_void_p,  # pEffectChain
+    c_uint32,  # StreamCategory
+)
+_CREATE_SOURCE_VOICE_PROTO = WINFUNCTYPE(
+    c_uint32,
+    c_void_p,  # this
+    POINTER(c_void_p),  # ppSourceVoice
+    POINTER(WAVEFORMATEX),  # pSourceFormat
+    c_uint32,  # Flags
+    c_float,  # MaxFrequencyRatio
+    c_void_p,  # pCallback
+    c_void_p,  # pSendList
+    c_void_p,  # pEffectChain
+)
+
 
 class XAudio2Backend(IAudioBackend):
     """XAudio2 backend implementation."""
 
+    __slots__ = (
+        "_com_initializer",
+        "_xaudio2",
+        "_mastering_voice",
+        "_initialized",
+        "_next_voice_id",
+        "_this_ptr",
+        "_create_source_voice",
+        "_release",
+        "_commit_changes",
+    )
+
     def __init__(self):
         self._com_initializer: Optional[COMInitializer] = None
         self._xaudio2: Optional[ctypes.POINTER(IXAudio2)] = None
         self._mastering_voice: Optional[MasteringVoice] = None
         self._initialized = False
         self._next_voice_id = 0
+        self._this_ptr: Optional[c_void_p] = None
+        # Vtable callables, bound once in initialize()
+        self._create_source_voice = None
+        self._release = None
+        self._commit_changes = None
 
     def initialize(self) -> None:
         """Initialize XAudio2 backend (called in worker thread)."""
@@ -58,39 +104,29 @@ class XAudio2Backend(IAudioBackend):
         # Cast to IXAudio2
         # xaudio2_ptr.value contains the pointer address
         self._xaudio2 = cast(xaudio2_ptr.value, POINTER(IXAudio2))
+        # 'this' argument for every IXAudio2 vtable call
+        self._this_ptr = c_void_p(xaudio2_ptr.value)
 
-        # Start engine
-        # Get function pointer from vtable and convert to callable function
-        StartEngineFunc = CFUNCTYPE(c_uint32, c_void_p)
-        start_engine_ptr = self._xaudio2.contents.lpVtbl.contents.StartEngine
-        start_engine_func = cast(start_engine_ptr, StartEngineFunc)
+        # Resolve the vtable methods we call into callables once
+        vtbl = self._xaudio2.contents.lpVtbl.contents
+        start_engine_func = cast(vtbl.StartEngine, _START_ENGINE_PROTO)
+        create_mastering_voice_func = cast(
+            vtbl.CreateMasteringVoice, _CREATE_MASTERING_VOICE_PROTO
+        )
+        self._create_source_voice = cast(
+            vtbl.CreateSourceVoice, _CREATE_SOURCE_VOICE_PROTO
+        )
+        self._release = cast(vtbl.Release, _RELEASE_PROTO)
+        self._commit_changes = cast(vtbl.CommitChanges, _COMMIT_CHANGES_PROTO)
 
-        hresult = start_engine_func(cast(self._xaudio2, c_void_p))
+        # Start engine
+        hresult = start_engine_func(self._this_ptr)
         hrcheck(hresult, "StartEngine failed")
 
         # Create mastering voice
-        # Get function pointer from vtable and convert to callable function
-        CreateMasteringVoiceFunc = CFUNCTYPE(
-            c_uint32,
-            c_void_p,  # this
-            POINTER(c_void_p),  # ppMasteringVoice
-            c_uint32,  # InputChannels
-            c_uint32,  # InputSampleRate
-            c_uint32,  # Flags
-            c_void_p,  # szDeviceId
-            c_void_p,  # pEffectChain
-            c_uint32,  # StreamCategory
-        )
-        create_mastering_voice_ptr = (
-            self._xaudio2.contents.lpVtbl.contents.CreateMasteringVoice
-        )
-        create_mastering_voice_func = cast(
-            create_mastering_voice_ptr, CreateMasteringVoiceFunc
-        )
-
         mastering_voice_ptr = c_void_p()
         hresult = create_mastering_voice_func(
-            cast(self._xaudio2, c_void_p),
+            self._this_ptr,
             byref(mastering_voice_ptr),
             0,  # InputChannels (default)
             0,  # InputSampleRate (default)
@@ -117,100 +153,120 @@ class XAudio2Backend(IAudioBackend):
             format.sample_rate, format.channels, format.bits_per_sample
         )
 
-        # Get CreateSourceVoice function
-        from xaudio2py.backends.xaudio2.bindings import WAVEFORMATEX
-        CreateSourceVoiceFunc = CFUNCTYPE(
-            c_uint32,
-            c_void_p,  # this
-            POINTER(c_void_p),  # ppSourceVoice
-            POINTER(WAVEFORMATEX),  # pSourceFormat
-            c_uint32,  # Flags
-            c_float,  # MaxFrequencyRatio
-            c_void_p,  # pCallback
-            c_void_p,  # pSendList
-            c_void_p,  # pEffectChain
-        )
-        create_source_voice_ptr = (
-            self._xaudio2.contents.lpVtbl.contents.CreateSourceVoice
-        )
-        create_source_voice_func = cast(create_source_voice_ptr, CreateSourceVoiceFunc)
+        # Validate AudioBytes is multiple of block align before creating
+        # the voice, so a bad buffer does not leak a source voice
+        audio_bytes = len(data)
+        n_block_align = wave_format.nBlockAlign
+        if audio_bytes % n_block_align != 0:
+            from xaudio2py.core.exceptions import InvalidAudioFormat
+            raise InvalidAudioFormat(
+                f"AudioBytes ({audio_bytes}) must be multiple of nBlockAlign ({n_block_align})"
+            )
 
-        # Create source voice
+        # Create source voice; the callback signals when playback completes
+        callback = VoiceCallback()
         source_voice_ptr = c_void_p()
-        hresult = create_source_voice_func(
-            cast(self._xaudio2, c_void_p),
-            byref(source_voice_ptr),
-            byref(wave_format),
-            0,  # Flags
-            2.0,  # MaxFrequencyRatio
-            None,  # Callback
-            None,  # SendList
-            None,  # EffectChain
-        )
-        hrcheck(hresult, "CreateSourceVoice failed")
-        
-        # Validate that pointer was actually set
-        if not source_voice_ptr or not source_voice_ptr.value:
-            from xaudio2py.core.exceptions import XAudio2Error
-            raise XAudio2Error(-1, "CreateSourceVoice returned NULL voice pointer")
+        try:
+            hresult = self._create_source_voice(
+                self._this_ptr,
+                byref(source_voice_ptr),
+                byref(wave_format),
+                0,  # Flags
+                2.0,  # MaxFrequencyRatio
+                callback.address,  # Callback
+                None,  # SendList
+                None,  # EffectChain
+            )
+            hrcheck(hresult, "CreateSourceVoice failed")
+            
+            # Validate that pointer was actually set
+            if not source_voice_ptr or not source_voice_ptr.value:
+                from xaudio2py.core.exceptions import XAudio2Error
+                raise XAudio2Error("CreateSourceVoice returned NULL voice pointer")
+        except BaseException:
+            # No voice refers to the callback
+            callback.release()
+            raise
         
-        logger.debug(f"CreateSourceVoice succeeded: voice_ptr=0x{source_voice_ptr.value:X}")
+        logger.debug("CreateSourceVoice succeeded: voice_ptr=0x%X", source_voice_ptr.value)
 
-        voice = SourceVoice(source_voice_ptr, format.channels)
+        # If the wrapper cannot be built the voice's vtable is unusable, so
+        # DestroyVoice cannot be called either; the callback stays registered
+        # (leaked, never freed under the native voice).
+        voice = SourceVoice(
+            source_voice_ptr, format.channels, callback, self.commit_changes
+        )
+        try:
+            self._prepare_voice(voice, data, audio_bytes, params)
+        except BaseException:
+            voice.destroy()
+            raise
 
+        logger.debug("Created XAudio2 SourceVoice and started playback")
+        return voice
+
+    @staticmethod
+    def _prepare_voice(
+        voice: SourceVoice, data: bytes, audio_bytes: int, params: VoiceParams
+    ) -> None:
+        """Apply initial volume/pan, submit the PCM buffer and start the voice."""
         # Set initial volume and pan
         voice.set_volume(params.volume)
         voice.set_pan(params.pan)
 
         # Submit buffer - need to keep data alive
-        # Create array that will be kept alive - MUST be stored BEFORE submission
-        audio_array = (ctypes.c_uint8 * len(data)).from_buffer_copy(data)
-        
-        # Store reference in voice FIRST to ensure GC doesn't collect it
-        voice._audio_data = audio_array
+        # XAudio2 only reads the buffer, so point it straight at the bytes
+        # object's storage instead of copying the PCM on every play().
+        if isinstance(data, bytes):
+            audio_array = ctypes.c_char_p(data)
+            audio_ptr = ctypes.cast(audio_array, POINTER(ctypes.c_uint8))
+        else:
+            array_type = ctypes.c_uint8 * len(data)
+            try:
+                # Writable buffers (bytearray, memoryview) can be shared too
+                audio_array = array_type.from_buffer(data)
+            except TypeError:
+                # Read-only non-bytes buffer: fall back to a private copy
+                audio_array = array_type.from_buffer_copy(data)
+            # c_uint8 arrays decay to POINTER(c_uint8) on field assignment
+            audio_ptr = audio_array
         
-        buffer = XAUDIO2_BUFFER()
-        # For MVP, use Flags = 0 (safest option)
-        # END_OF_STREAM is optional and can be added later if needed
-        buffer.Flags = 0
-        buffer.AudioBytes = len(data)
+        # Fields not passed (PlayBegin/PlayLength, LoopBegin/LoopLength,
+        # pContext) are zero-initialised: play and loop the entire buffer.
+        buffer = XAUDIO2_BUFFER(
+            # For MVP, use Flags = 0 (safest option)
+            # END_OF_STREAM is optional and can be added later if needed
+            Flags=0,
+            AudioBytes=audio_bytes,
+            pAudioData=audio_ptr,
+            LoopCount=XAUDIO2_LOOP_INFINITE if params.loop else 0,
+        )
         
-        # Validate AudioBytes is multiple of block align
-        # nBlockAlign = (channels * bits_per_sample) // 8
-        n_block_align = (format.channels * format.bits_per_sample) // 8
-        if buffer.AudioBytes % n_block_align != 0:
-            from xaudio2py.core.exceptions import InvalidAudioFormat
-            raise InvalidAudioFormat(
-                f"AudioBytes ({buffer.AudioBytes}) must be multiple of nBlockAlign ({n_block_align})"
+        # Diagnostic logging (skipped entirely unless DEBUG is enabled)
+        if logger.isEnabledFor(logging.DEBUG):
+            voice_ptr_addr = voice._this
+            audio_addr = ctypes.cast(buffer.pAudioData, c_void_p).value or 0
+            logger.debug(
+                "Preparing buffer: AudioBytes=%d, pAudioData=0x%X, voice_ptr=0x%X, "
+                "Flags=0x%X, LoopCount=%d",
+                buffer.AudioBytes,
+                audio_addr,
+                voice_ptr_addr,
+                buffer.Flags,
+                buffer.LoopCount,
             )
-        
-        buffer.pAudioData = ctypes.cast(audio_array, POINTER(ctypes.c_uint8))
-        buffer.PlayBegin = 0
-        buffer.PlayLength = 0  # Play entire buffer
-        buffer.LoopBegin = 0
-        buffer.LoopLength = 0
-        buffer.LoopCount = XAUDIO2_LOOP_INFINITE if params.loop else 0
-        buffer.pContext = None
-        
-        # Diagnostic logging
-        pAudioData_addr = ctypes.addressof(audio_array) if audio_array else 0
-        voice_ptr_addr = voice._voice_ptr.value if voice._voice_ptr and voice._voice_ptr.value else 0
-        logger.info(
-            f"Preparing buffer: AudioBytes={buffer.AudioBytes}, "
-            f"pAudioData=0x{pAudioData_addr:X}, "
-            f"voice_ptr=0x{voice_ptr_addr:X}, "
-            f"Flags=0x{buffer.Flags:X}, LoopCount={buffer.LoopCount}"
-        )
 
-        # Submit buffer using voice method
-        voice.submit_buffer(buffer)
+        # Submit buffer; the voice keeps data/audio_array alive while it plays
+        voice.submit_buffer(buffer, (data, audio_array))
         
         # Start playback immediately after submitting buffer
         # This ensures the voice starts playing the submitted buffer
         voice.start()
 
-        logger.debug("Created XAudio2 SourceVoice and started playback")
-        return voice
+    def commit_changes(self, operation_set: int) -> None:
+        """Apply all voice changes deferred under operation_set at once."""
+        hresult = self._commit_changes(self._this_ptr, operation_set)
+        hrcheck(hresult, "CommitChanges failed")
 
     def set_master_volume(self, volume: float) -> None:
         """Set master volume (0.0 to 1.0)."""
@@ -232,12 +288,12 @@ class XAudio2Backend(IAudioBackend):
 
         # Release XAudio2
         if self._xaudio2 is not None:
-            ReleaseFunc = CFUNCTYPE(c_uint32, c_void_p)
-            release_ptr = self._xaudio2.contents.lpVtbl.contents.Release
-            release_func = cast(release_ptr, ReleaseFunc)
-
-            release_func(cast(self._xaudio2, c_void_p))
+            self._release(self._this_ptr)
             self._xaudio2 = None
+            self._this_ptr = None
+            self._create_source_voice = None
+            self._release = None
+            self._commit_changes = None
 
         # Uninitialize COM
         if self._com_initializer is not None:
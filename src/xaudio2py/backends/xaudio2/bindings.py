@@ -1,5 +1,7 @@
 """ctypes bindings for XAudio2 structures and constants."""
 
+import struct
+from functools import lru_cache
 from ctypes import (
     Structure,
     c_uint8,
@@ -97,10 +99,16 @@ class XAUDIO2_VOICE_STATE(Structure):
     ]
 
 
-def create_waveformatex(
+# Native-aligned layout of XAUDIO2_VOICE_STATE, for reading all fields in
+# one unpack_from() call instead of one ctypes descriptor lookup per field
+VOICE_STATE_STRUCT = struct.Struct("PIQ")
+
+
+@lru_cache(maxsize=32)
+def _waveformatex_template(
     sample_rate: int, channels: int, bits_per_sample: int
-) -> WAVEFORMATEX:
-    """Create WAVEFORMATEX structure."""
+) -> bytes:
+    """Build the raw bytes of a WAVEFORMATEX (cached per format)."""
     fmt = WAVEFORMATEX()
     fmt.wFormatTag = WAVE_FORMAT_PCM
     fmt.nChannels = channels
@@ -109,5 +117,19 @@ def create_waveformatex(
     fmt.nBlockAlign = (channels * bits_per_sample) // 8
     fmt.nAvgBytesPerSec = sample_rate * fmt.nBlockAlign
     fmt.cbSize = 0
-    return fmt
+    return bytes(fmt)
+
+
+def create_waveformatex(
+    sample_rate: int, channels: int, bits_per_sample: int
+) -> WAVEFORMATEX:
+    """
+    Create WAVEFORMATEX structure.
+
+    Applications use a handful of formats, so each is built once and later
+    calls only copy the cached bytes into a fresh structure.
+    """
+    return WAVEFORMATEX.from_buffer_copy(
+        _waveformatex_template(sample_rate, channels, bits_per_sample)
+    )
 
@@ -45,6 +45,8 @@ def CoUninitialize() -> None:
 class COMInitializer:
     """Context manager for COM initialization."""
 
+    __slots__ = ("dwCoInit", "_initialized")
+
     def __init__(self, dwCoInit: int = COINIT_MULTITHREADED):
         self.dwCoInit = dwCoInit
         self._initialized = False
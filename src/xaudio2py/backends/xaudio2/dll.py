@@ -1,8 +1,9 @@
 """DLL loader and function resolution for XAudio2."""
 
+import functools
 import os
 import sys
-from ctypes import WinDLL, c_void_p, POINTER, Structure
+from ctypes import WinDLL, WinError, get_last_error, c_void_p, c_uint32, c_wchar_p, POINTER, Structure
 from pathlib import Path
 from typing import Optional, Tuple
 from xaudio2py.core.exceptions import BackendError, XAudio2Error
@@ -18,10 +19,62 @@ DLL_NAMES = [
     "xaudio2_7.dll",
 ]
 
+# LoadLibraryExW flags: resolve the DLL's own dependencies only from its
+# directory, the application directory and System32 (no cwd / PATH walk)
+LOAD_LIBRARY_SEARCH_DLL_LOAD_DIR = 0x00000100
+LOAD_LIBRARY_SEARCH_APPLICATION_DIR = 0x00000200
+LOAD_LIBRARY_SEARCH_SYSTEM32 = 0x00000800
+_LOAD_FLAGS = (
+    LOAD_LIBRARY_SEARCH_DLL_LOAD_DIR
+    | LOAD_LIBRARY_SEARCH_APPLICATION_DIR
+    | LOAD_LIBRARY_SEARCH_SYSTEM32
+)
+
+_kernel32 = WinDLL("kernel32", use_last_error=True)
+_kernel32.LoadLibraryExW.argtypes = [c_wchar_p, c_void_p, c_uint32]
+_kernel32.LoadLibraryExW.restype = c_void_p  # HMODULE
+
+# bin/ directory of the project checkout (repo/bin), resolved once at import
+_BIN_DIR = Path(__file__).parents[4] / "bin"
+
+
+@functools.cache
+def _locate_xaudio2_dll() -> Optional[str]:
+    """
+    Find XAudio2 DLL in search paths.
+
+    The result (including a failed lookup) is cached for the lifetime of
+    the process, so repeated backend instantiation does no filesystem work.
+    """
+    # Search paths:
+    # 1. bin/ directory (project structure)
+    # 2. Python directory
+    # 3. System directories
+    # The current directory is deliberately not searched (DLL planting).
+    search_paths = [
+        _BIN_DIR,
+        Path(sys.executable).parent,  # Python directory
+    ]
+
+    # Also check system directories
+    system_root = Path(os.environ.get("SystemRoot", "C:\\Windows"))
+    search_paths.append(system_root / "System32")
+    search_paths.append(system_root / "SysWOW64")
+
+    for dll_name in DLL_NAMES:
+        for search_path in search_paths:
+            dll_path = search_path / dll_name
+            if dll_path.exists():
+                return str(dll_path)
+
+    return None
+
 
 class XAudio2DLL:
     """XAudio2 DLL loader and function resolver."""
 
+    __slots__ = ("_dll", "_dll_path", "_XAudio2Create")
+
     def __init__(self):
         self._dll: Optional[WinDLL] = None
         self._dll_path: Optional[str] = None
@@ -48,14 +101,14 @@ class XAudio2DLL:
                 hresult=0x80070002,  # ERROR_FILE_NOT_FOUND
             )
 
-        # Load DLL
-        try:
-            dll = WinDLL(dll_path)
-        except OSError as e:
+        # Load DLL with a restricted dependency search path
+        hmodule = _kernel32.LoadLibraryExW(dll_path, None, _LOAD_FLAGS)
+        if not hmodule:
             raise BackendError(
-                f"Failed to load {dll_path}: {e}",
+                f"Failed to load {dll_path}: {WinError(get_last_error())}",
                 hresult=0x80070005,  # ERROR_ACCESS_DENIED
             )
+        dll = WinDLL(dll_path, handle=hmodule)
 
         # Resolve XAudio2Create
         try:
@@ -68,7 +121,6 @@ class XAudio2DLL:
 
         # Set function signature
         # XAudio2Create(ppXAudio2: POINTER(c_void_p), Flags: UINT32, XAudio2Processor: UINT32)
-        from ctypes import c_uint32
         XAudio2Create.argtypes = [POINTER(c_void_p), c_uint32, c_uint32]
         XAudio2Create.restype = c_uint32  # HRESULT
 
@@ -76,7 +128,7 @@ class XAudio2DLL:
         self._dll_path = dll_path
         self._XAudio2Create = XAudio2Create
 
-        logger.info(f"Loaded XAudio2 DLL: {dll_path}")
+        logger.info("Loaded XAudio2 DLL: %s", dll_path)
         return dll, dll_path
 
     def get_XAudio2Create(self):
@@ -87,30 +139,7 @@ class XAudio2DLL:
 
     def _find_dll(self) -> Optional[str]:
         """Find XAudio2 DLL in search paths."""
-        # Search paths:
-        # 1. Current directory
-        # 2. bin/ directory (project structure)
-        # 3. System PATH
-        search_paths = [
-            Path.cwd(),
-            Path(__file__).parent.parent.parent.parent.parent / "bin",  # repo/bin
-            Path(sys.executable).parent,  # Python directory
-        ]
-
-        # Also check system directories
-        system_dirs = [
-            Path(os.environ.get("SystemRoot", "C:\\Windows")) / "System32",
-            Path(os.environ.get("SystemRoot", "C:\\Windows")) / "SysWOW64",
-        ]
-        search_paths.extend(system_dirs)
-
-        for dll_name in DLL_NAMES:
-            for search_path in search_paths:
-                dll_path = search_path / dll_name
-                if dll_path.exists():
-                    return str(dll_path)
-
-        return None
+        return _locate_xaudio2_dll()
 
 
 # Global instance
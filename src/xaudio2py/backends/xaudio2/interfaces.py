@@ -8,8 +8,14 @@ from ctypes import (
     c_float,
     c_uint8,
     c_uint64,
-    CFUNCTYPE,
 )
+
+try:
+    from ctypes import WINFUNCTYPE
+except ImportError:
+    # Non-Windows: keep the declarations importable (e.g. for tests);
+    # on x64 both conventions are identical anyway.
+    from ctypes import CFUNCTYPE as WINFUNCTYPE
 from xaudio2py.backends.xaudio2.bindings import (
     WAVEFORMATEX,
     XAUDIO2_BUFFER,
@@ -38,7 +44,6 @@ class IXAudio2Vtbl(Structure):
         ("GetDeviceCount", c_void_p),
         ("GetDeviceDetails", c_void_p),
         ("Initialize", c_void_p),
-        ("Release", c_void_p),  # Duplicate, but that's how it is
     ]
 
 
@@ -129,6 +134,38 @@ class IXAudio2SourceVoice(Structure):
     _fields_ = [("lpVtbl", POINTER(IXAudio2SourceVoiceVtbl))]
 
 
+# IXAudio2VoiceCallback method signatures (all return void)
+OnVoiceProcessingPassStartFunc = WINFUNCTYPE(None, c_void_p, c_uint32)
+OnVoiceEventFunc = WINFUNCTYPE(None, c_void_p)
+OnBufferEventFunc = WINFUNCTYPE(None, c_void_p, c_void_p)
+OnVoiceErrorFunc = WINFUNCTYPE(None, c_void_p, c_void_p, c_uint32)
+
+
+class IXAudio2VoiceCallbackVtbl(Structure):
+    """
+    IXAudio2VoiceCallback vtable.
+    
+    Like the voice interfaces, IXAudio2VoiceCallback does not derive from
+    IUnknown, so the vtable starts directly with its own methods.
+    """
+
+    _fields_ = [
+        ("OnVoiceProcessingPassStart", OnVoiceProcessingPassStartFunc),
+        ("OnVoiceProcessingPassEnd", OnVoiceEventFunc),
+        ("OnStreamEnd", OnVoiceEventFunc),
+        ("OnBufferStart", OnBufferEventFunc),
+        ("OnBufferEnd", OnBufferEventFunc),
+        ("OnLoopEnd", OnBufferEventFunc),
+        ("OnVoiceError", OnVoiceErrorFunc),
+    ]
+
+
+class IXAudio2VoiceCallback(Structure):
+    """IXAudio2VoiceCallback interface."""
+
+    _fields_ = [("lpVtbl", POINTER(IXAudio2VoiceCallbackVtbl))]
+
+
 # Function signatures for calling vtable methods
 # These will be set up dynamically when we get the interface pointer
 
@@ -1,10 +1,15 @@
 """Voice wrappers for XAudio2."""
 
 import ctypes
-from ctypes import POINTER, c_void_p, c_uint32, c_float, byref, cast, CFUNCTYPE
+import logging
+import threading
+from functools import lru_cache
+from ctypes import POINTER, c_void_p, c_uint32, c_float, byref, cast, pointer, addressof, sizeof, WINFUNCTYPE
+from typing import Callable, Dict, Optional
 from xaudio2py.backends.xaudio2.bindings import (
     XAUDIO2_BUFFER,
     XAUDIO2_VOICE_STATE,
+    VOICE_STATE_STRUCT,
     XAUDIO2_END_OF_STREAM,
     XAUDIO2_LOOP_INFINITE,
 )
@@ -13,162 +18,281 @@ from xaudio2py.backends.xaudio2.interfaces import (
     IXAudio2Voice,
     IXAudio2SourceVoiceVtbl,
     IXAudio2VoiceVtbl,
+    IXAudio2VoiceCallback,
+    IXAudio2VoiceCallbackVtbl,
+    OnVoiceProcessingPassStartFunc,
+    OnVoiceEventFunc,
+    OnBufferEventFunc,
+    OnVoiceErrorFunc,
 )
 from xaudio2py.backends.xaudio2.utils import hrcheck, pan_to_matrix
+from xaudio2py.core.exceptions import XAudio2Error
 from xaudio2py.core.interfaces import IVoice
 from xaudio2py.core.models import PlaybackState
 from xaudio2py.utils.log import get_logger
+from xaudio2py.utils.validate import validate_pan, validate_volume
 
 logger = get_logger(__name__)
 
+# Vtable method prototypes, built once and cast onto each voice's vtable
+_HRESULT = c_uint32
+_START_PROTO = WINFUNCTYPE(_HRESULT, c_void_p, c_uint32, c_uint32)  # Flags, OperationSet
+_STOP_PROTO = WINFUNCTYPE(_HRESULT, c_void_p, c_uint32, c_uint32)  # Flags, OperationSet
+_SUBMIT_SOURCE_BUFFER_PROTO = WINFUNCTYPE(
+    _HRESULT,
+    c_void_p,  # this (IXAudio2SourceVoice*)
+    POINTER(XAUDIO2_BUFFER),  # pBuffer
+    c_void_p,  # pBufferWMA (usually NULL)
+)
+_FLUSH_SOURCE_BUFFERS_PROTO = WINFUNCTYPE(_HRESULT, c_void_p)
+# GetState returns void, not an HRESULT
+_GET_STATE_PROTO = WINFUNCTYPE(None, c_void_p, POINTER(XAUDIO2_VOICE_STATE), c_uint32)
+_SET_VOLUME_PROTO = WINFUNCTYPE(_HRESULT, c_void_p, c_float, c_uint32)
+_SET_OUTPUT_MATRIX_PROTO = WINFUNCTYPE(
+    _HRESULT,
+    c_void_p,  # this
+    c_void_p,  # pDestinationVoice
+    c_uint32,  # SourceChannels
+    c_uint32,  # DestinationChannels
+    POINTER(c_float),  # pLevelMatrix
+    c_uint32,  # OperationSet
+)
+_DESTROY_VOICE_PROTO = WINFUNCTYPE(None, c_void_p)
+
+
+# set_pan quantizes pan to 1/1024 steps so repeated values share one matrix
+_PAN_STEPS = 1024
+
+
+@lru_cache(maxsize=256)
+def _pan_matrix_array(pan_q: int, source_channels: int):
+    """Build the stereo-output SetOutputMatrix array for a quantized pan."""
+    matrix = pan_to_matrix(pan_q / _PAN_STEPS, 2, source_channels)
+    # XAudio2 copies the levels, so the cached array is never written to
+    return (c_float * len(matrix))(*matrix)
+
+
+# Callbacks that XAudio2 may still call, by the address it was given
+# (the 'this' pointer). An entry is only removed after DestroyVoice, so native
+# code never calls into a freed IXAudio2VoiceCallback even if its Python
+# wrapper is dropped without being destroyed.
+_live_callbacks: Dict[int, "VoiceCallback"] = {}
+
+
+def _on_buffer_end(this, context):
+    # Fires when the buffer has been fully played (including all loops)
+    # or flushed by Stop, i.e. whenever the voice has nothing left to play.
+    callback = _live_callbacks.get(this)
+    if callback is not None:
+        callback.finished.set()
+
+
+def _on_voice_error(this, context, hresult):
+    # Don't leave waiters hanging on a voice that will never finish
+    callback = _live_callbacks.get(this)
+    if callback is not None:
+        callback.finished.set()
+
+
+def _build_callback_vtable() -> IXAudio2VoiceCallbackVtbl:
+    """Build the IXAudio2VoiceCallback vtable shared by every voice."""
+    voice_event = OnVoiceEventFunc(lambda this: None)
+    buffer_event = OnBufferEventFunc(lambda this, context: None)
+    return IXAudio2VoiceCallbackVtbl(
+        OnVoiceProcessingPassStartFunc(lambda this, bytes_required: None),
+        voice_event,  # OnVoiceProcessingPassEnd
+        voice_event,  # OnStreamEnd
+        buffer_event,  # OnBufferStart
+        OnBufferEventFunc(_on_buffer_end),
+        buffer_event,  # OnLoopEnd
+        OnVoiceErrorFunc(_on_voice_error),
+    )
+
+
+# Built once per process; keeps the ctypes thunks alive
+_CALLBACK_VTBL = _build_callback_vtable()
+_CALLBACK_VTBL_PTR = pointer(_CALLBACK_VTBL)
+
+
+class VoiceCallback:
+    """
+    IXAudio2VoiceCallback instance for one voice, signalling buffer completion.
+
+    All instances share the module-level vtable; the thunks find the voice's
+    completion event through the 'this' pointer XAudio2 passes back. XAudio2
+    invokes them on its audio processing thread, so they only set an Event.
+    """
+
+    __slots__ = ("finished", "_interface", "address")
+
+    def __init__(self):
+        self.finished = threading.Event()
+        self._interface = IXAudio2VoiceCallback(_CALLBACK_VTBL_PTR)
+        # Address of the IXAudio2VoiceCallback to pass to CreateSourceVoice
+        self.address = addressof(self._interface)
+        _live_callbacks[self.address] = self
+
+    def release(self) -> None:
+        """
+        Stop routing callbacks to this instance.
+
+        Only call once no voice refers to it any more: after DestroyVoice,
+        or when CreateSourceVoice failed.
+        """
+        _live_callbacks.pop(self.address, None)
+
 
 class SourceVoice(IVoice):
     """Wrapper for IXAudio2SourceVoice."""
 
-    def __init__(self, voice_ptr: c_void_p, format_channels: int):
+    def __init__(
+        self,
+        voice_ptr: c_void_p,
+        format_channels: int,
+        callback: VoiceCallback,
+        commit_changes: Optional[Callable[[int], None]] = None,
+    ):
         """
         Initialize SourceVoice wrapper.
 
         Args:
             voice_ptr: Pointer to IXAudio2SourceVoice COM object.
             format_channels: Number of channels in source format.
+            callback: Callback registered with the voice in CreateSourceVoice.
+            commit_changes: IXAudio2::CommitChanges wrapper used by end_batch().
         """
         self._voice_ptr = voice_ptr
+        # Raw address passed as 'this'; c_void_p args accept plain ints
+        self._this = voice_ptr.value if isinstance(voice_ptr, c_void_p) else int(voice_ptr)
+        self._callback = callback
         self._format_channels = format_channels
         self._voice = cast(voice_ptr, POINTER(IXAudio2SourceVoice)).contents
         self._base_voice = cast(voice_ptr, POINTER(IXAudio2Voice)).contents
+
+        # Resolve the vtable once; every call below goes straight through these
+        vtbl = self._voice.lpVtbl.contents
+        if not vtbl.Start:
+            raise XAudio2Error("Start vtable entry is NULL")
+        submit_buffer_ptr = vtbl.SubmitSourceBuffer
+        if not submit_buffer_ptr or submit_buffer_ptr == 0xFFFFFFFFFFFFFFFF:
+            raise XAudio2Error(
+                f"SubmitSourceBuffer vtable entry is invalid: 0x{submit_buffer_ptr or 0:X}"
+            )
+        self._start = cast(vtbl.Start, _START_PROTO)
+        self._stop = cast(vtbl.Stop, _STOP_PROTO)
+        self._submit_source_buffer = cast(submit_buffer_ptr, _SUBMIT_SOURCE_BUFFER_PROTO)
+        self._flush_source_buffers = cast(vtbl.FlushSourceBuffers, _FLUSH_SOURCE_BUFFERS_PROTO)
+        self._get_state = cast(vtbl.GetState, _GET_STATE_PROTO)
+        self._set_volume = cast(vtbl.SetVolume, _SET_VOLUME_PROTO)
+        self._set_output_matrix = cast(vtbl.SetOutputMatrix, _SET_OUTPUT_MATRIX_PROTO)
+        self._destroy_voice = cast(vtbl.DestroyVoice, _DESTROY_VOICE_PROTO)
+
+        self._commit_changes = commit_changes
+        # Nonzero while batching: SetVolume/SetOutputMatrix are deferred
+        self._operation_set = 0
+
+        # Reused by every GetState call (worker thread only)
+        self._state_buf = XAUDIO2_VOICE_STATE()
+        self._state_buf_ref = byref(self._state_buf)
+
         self._state = PlaybackState.STOPPED
         self._buffer_submitted = False
         self._audio_data = None  # Keep reference to audio data
 
     def start(self) -> None:
         """Start playback."""
-        # Get Start function from vtable
-        StartFunc = CFUNCTYPE(c_uint32, c_void_p, c_uint32, c_uint32)
-        start_ptr = self._voice.lpVtbl.contents.Start
-        if not start_ptr:
-            from xaudio2py.core.exceptions import XAudio2Error
-            raise XAudio2Error(-1, "Start vtable entry is NULL")
-        
-        start_func = cast(start_ptr, StartFunc)
-
+        if not self._this:
+            raise XAudio2Error("Voice pointer is NULL in start (voice destroyed)")
         # Check buffer status before starting
         if not self._buffer_submitted:
             logger.warning("Starting voice without submitted buffer!")
         else:
-            logger.info("Starting voice with submitted buffer")
+            logger.debug("Starting voice with submitted buffer")
         
-        hresult = start_func(self._voice_ptr, 0, 0)  # Flags, OperationSet
+        hresult = self._start(self._this, 0, 0)  # Flags, OperationSet
         hrcheck(hresult, "Start failed")
         self._state = PlaybackState.PLAYING
-        logger.info(f"SourceVoice: started successfully (voice_ptr=0x{self._voice_ptr.value:X})")
+        logger.debug("SourceVoice: started (voice_ptr=0x%X)", self._this)
         
-        # Verify state immediately after start
-        from xaudio2py.backends.xaudio2.bindings import XAUDIO2_VOICE_STATE
-        temp_state = XAUDIO2_VOICE_STATE()
-        GetStateFunc = CFUNCTYPE(c_uint32, c_void_p, POINTER(XAUDIO2_VOICE_STATE), c_uint32)
-        get_state_ptr = self._voice.lpVtbl.contents.GetState
-        if get_state_ptr:
-            get_state_func = cast(get_state_ptr, GetStateFunc)
-            hr = get_state_func(self._voice_ptr, byref(temp_state), 0)
-            if hr >= 0:
-                logger.info(f"Voice state immediately after start: BuffersQueued={temp_state.BuffersQueued}, SamplesPlayed={temp_state.SamplesPlayed}")
-            else:
-                from xaudio2py.backends.xaudio2.utils import hr_to_hex
-                logger.warning(f"GetState failed immediately after start: HRESULT {hr_to_hex(hr)}")
+        # Verify state immediately after start (extra COM call, debug only)
+        if logger.isEnabledFor(logging.DEBUG):
+            samples_played, buffers_queued = self.get_progress()
+            logger.debug(
+                "Voice state immediately after start: BuffersQueued=%d, SamplesPlayed=%d",
+                buffers_queued,
+                samples_played,
+            )
 
     def stop(self) -> None:
-        """Stop playback and flush buffers."""
-        # Get Stop function
-        StopFunc = CFUNCTYPE(c_uint32, c_void_p, c_uint32, c_uint32)
-        stop_ptr = self._voice.lpVtbl.contents.Stop
-        stop_func = cast(stop_ptr, StopFunc)
-
-        hresult = stop_func(self._voice_ptr, 0, 0)  # Flags, OperationSet
+        """Stop playback and flush buffers (no-op once destroyed)."""
+        if not self._this:
+            return
+        hresult = self._stop(self._this, 0, 0)  # Flags, OperationSet
         hrcheck(hresult, "Stop failed")
 
         # Flush buffers
-        FlushFunc = CFUNCTYPE(c_uint32, c_void_p)
-        flush_ptr = self._voice.lpVtbl.contents.FlushSourceBuffers
-        flush_func = cast(flush_ptr, FlushFunc)
-
-        hresult = flush_func(self._voice_ptr)
+        hresult = self._flush_source_buffers(self._this)
         hrcheck(hresult, "FlushSourceBuffers failed")
 
         self._state = PlaybackState.STOPPED
         self._buffer_submitted = False
+        # OnBufferEnd for the flushed buffer arrives asynchronously
+        self._callback.finished.set()
         logger.debug("SourceVoice: stopped")
 
-    def submit_buffer(self, buffer) -> None:
-        """Submit audio buffer for playback."""
-        from xaudio2py.backends.xaudio2.bindings import XAUDIO2_BUFFER
-        from xaudio2py.core.exceptions import XAudio2Error
-        from ctypes import byref, sizeof
-        
+    def submit_buffer(self, buffer, audio_data=None) -> None:
+        """
+        Submit audio buffer for playback.
+
+        XAudio2 reads pAudioData in place until the buffer has been played
+        or flushed, so whatever owns that memory must outlive the voice.
+
+        Args:
+            buffer: XAUDIO2_BUFFER pointing at the PCM data.
+            audio_data: Object(s) backing buffer.pAudioData; the voice keeps
+                a reference for as long as it exists.
+        """
         # Validate voice pointer
-        if not self._voice_ptr or not self._voice_ptr.value:
-            raise XAudio2Error(-1, "Voice pointer is NULL in submit_buffer")
+        if not self._this:
+            raise XAudio2Error("Voice pointer is NULL in submit_buffer (voice destroyed)")
+
+        # Pin the PCM memory before the device can start reading it
+        if audio_data is not None:
+            self._audio_data = audio_data
         
         # Diagnostic logging
-        # Get address of pAudioData pointer
-        pAudioData_addr = cast(buffer.pAudioData, c_void_p).value if buffer.pAudioData else 0
-        logger.debug(
-            f"submit_buffer: voice_ptr=0x{self._voice_ptr.value:X}, "
-            f"AudioBytes={buffer.AudioBytes}, "
-            f"pAudioData=0x{pAudioData_addr:X}, "
-            f"buffer_size={sizeof(buffer)}"
-        )
-        
-        # Get SubmitSourceBuffer function from vtable
-        # SubmitSourceBuffer is at index 20 (after 18 base methods + Start + Stop)
-        SubmitSourceBufferFunc = CFUNCTYPE(
-            c_uint32,  # HRESULT
-            c_void_p,  # this (IXAudio2SourceVoice*)
-            POINTER(XAUDIO2_BUFFER),  # pBuffer
-            c_void_p  # pBufferWMA (usually NULL)
-        )
-        
-        # Access vtable entry - this must be at the correct offset
-        vtable = self._voice.lpVtbl.contents
-        if not vtable:
-            raise XAudio2Error(-1, "VTable pointer is NULL")
-        
-        submit_buffer_ptr = vtable.SubmitSourceBuffer
-        if not submit_buffer_ptr or submit_buffer_ptr == 0xFFFFFFFFFFFFFFFF:
-            raise XAudio2Error(-1, f"SubmitSourceBuffer vtable entry is invalid: 0x{submit_buffer_ptr:X}")
+        if logger.isEnabledFor(logging.DEBUG):
+            # Get address of pAudioData pointer
+            pAudioData_addr = cast(buffer.pAudioData, c_void_p).value if buffer.pAudioData else 0
+            logger.debug(
+                "submit_buffer: voice_ptr=0x%X, AudioBytes=%d, pAudioData=0x%X, buffer_size=%d",
+                self._this,
+                buffer.AudioBytes,
+                pAudioData_addr,
+                sizeof(buffer),
+            )
         
-        submit_buffer_func = cast(submit_buffer_ptr, SubmitSourceBufferFunc)
-
         # Call the method - must pass voice pointer as 'this'
-        logger.info(f"Calling SubmitSourceBuffer: voice_ptr=0x{self._voice_ptr.value:X}, AudioBytes={buffer.AudioBytes}")
-        hresult = submit_buffer_func(self._voice_ptr, byref(buffer), None)
+        hresult = self._submit_source_buffer(self._this, byref(buffer), None)
         hrcheck(hresult, "SubmitSourceBuffer failed")
         self._buffer_submitted = True
-        from xaudio2py.backends.xaudio2.utils import hr_to_hex
-        logger.info(f"SubmitSourceBuffer succeeded with HRESULT {hr_to_hex(hresult)}")
+        logger.debug("SubmitSourceBuffer succeeded: AudioBytes=%d", buffer.AudioBytes)
         
-        # Verify buffer was queued
-        from xaudio2py.backends.xaudio2.bindings import XAUDIO2_VOICE_STATE
-        check_state = XAUDIO2_VOICE_STATE()
-        GetStateFunc = CFUNCTYPE(c_uint32, c_void_p, POINTER(XAUDIO2_VOICE_STATE), c_uint32)
-        get_state_ptr = self._voice.lpVtbl.contents.GetState
-        if get_state_ptr:
-            get_state_func = cast(get_state_ptr, GetStateFunc)
-            hr = get_state_func(self._voice_ptr, byref(check_state), 0)
-            if hr >= 0:
-                logger.info(f"Buffer state after submit: BuffersQueued={check_state.BuffersQueued}, SamplesPlayed={check_state.SamplesPlayed}")
-            else:
-                from xaudio2py.backends.xaudio2.utils import hr_to_hex
-                logger.warning(f"GetState failed after submit: HRESULT {hr_to_hex(hr)}")
+        # Verify buffer was queued (extra COM call, debug only)
+        if logger.isEnabledFor(logging.DEBUG):
+            samples_played, buffers_queued = self.get_progress()
+            logger.debug(
+                "Buffer state after submit: BuffersQueued=%d, SamplesPlayed=%d",
+                buffers_queued,
+                samples_played,
+            )
 
     def pause(self) -> None:
         """Pause playback."""
+        if not self._this:
+            raise XAudio2Error("Voice pointer is NULL in pause (voice destroyed)")
         # Pause is just Stop without flush
-        StopFunc = CFUNCTYPE(c_uint32, c_void_p, c_uint32, c_uint32)
-        stop_ptr = self._voice.lpVtbl.contents.Stop
-        stop_func = cast(stop_ptr, StopFunc)
-
-        hresult = stop_func(self._voice_ptr, 0, 0)
+        hresult = self._stop(self._this, 0, 0)
         hrcheck(hresult, "Pause (Stop) failed")
         self._state = PlaybackState.PAUSED
         logger.debug("SourceVoice: paused")
@@ -180,97 +304,101 @@ class SourceVoice(IVoice):
 
     def set_volume(self, volume: float) -> None:
         """Set volume (0.0 to 1.0)."""
-        # Clamp volume
-        volume = max(0.0, min(1.0, volume))
-
-        # Get SetVolume function from base voice vtable
-        SetVolumeFunc = CFUNCTYPE(c_uint32, c_void_p, c_float, c_uint32)
-        set_volume_ptr = self._base_voice.lpVtbl.contents.SetVolume
-        set_volume_func = cast(set_volume_ptr, SetVolumeFunc)
+        if not self._this:
+            raise XAudio2Error("Voice pointer is NULL in set_volume (voice destroyed)")
+        volume = validate_volume(volume)
 
-        hresult = set_volume_func(self._voice_ptr, c_float(volume), 0)  # OperationSet
+        hresult = self._set_volume(self._this, volume, self._operation_set)
         hrcheck(hresult, "SetVolume failed")
-        logger.debug(f"SourceVoice: volume={volume}")
+        logger.debug("SourceVoice: volume=%s", volume)
 
     def set_pan(self, pan: float) -> None:
         """Set pan (-1.0 left, 0.0 center, 1.0 right)."""
-        # Get SetOutputMatrix function
-        SetOutputMatrixFunc = CFUNCTYPE(
-            c_uint32,
-            c_void_p,  # this
-            c_void_p,  # pDestinationVoice
-            c_uint32,  # SourceChannels
-            c_uint32,  # DestinationChannels
-            POINTER(c_float),  # pLevelMatrix
-            c_uint32,  # OperationSet
-        )
-        set_matrix_ptr = self._base_voice.lpVtbl.contents.SetOutputMatrix
-        set_matrix_func = cast(set_matrix_ptr, SetOutputMatrixFunc)
-
-        # Calculate matrix coefficients
-        # For stereo output: [L->L, L->R, R->L, R->R]
-        matrix = pan_to_matrix(pan, 2)  # Assume stereo output
-        matrix_array = (c_float * len(matrix))(*matrix)
+        if not self._this:
+            raise XAudio2Error("Voice pointer is NULL in set_pan (voice destroyed)")
+        # Stereo output matrix, shared between calls with the same pan
+        pan = validate_pan(pan)
+        matrix_array = _pan_matrix_array(round(pan * _PAN_STEPS), self._format_channels)
 
         # Source channels: format_channels, Destination: 2 (stereo)
-        hresult = set_matrix_func(
-            self._voice_ptr,
+        hresult = self._set_output_matrix(
+            self._this,
             None,  # Output to mastering voice
             self._format_channels,
             2,  # Stereo output
             matrix_array,
-            0,  # OperationSet
+            self._operation_set,
         )
         hrcheck(hresult, "SetOutputMatrix failed")
-        logger.debug(f"SourceVoice: pan={pan}")
+        logger.debug("SourceVoice: pan=%s", pan)
+
+    def begin_batch(self, operation_set: int) -> None:
+        """Defer set_volume/set_pan into operation_set until end_batch()."""
+        if not self._this:
+            raise XAudio2Error("Voice pointer is NULL in begin_batch (voice destroyed)")
+        if operation_set <= 0:
+            raise ValueError("operation_set must be a positive integer")
+        self._operation_set = operation_set
+
+    def end_batch(self) -> None:
+        """Apply all deferred changes with a single CommitChanges call."""
+        operation_set, self._operation_set = self._operation_set, 0
+        # CommitChanges goes through the engine, but a destroyed voice has
+        # nothing pending to commit
+        if operation_set and self._this and self._commit_changes is not None:
+            self._commit_changes(operation_set)
+
+    @property
+    def state(self) -> PlaybackState:
+        """
+        Last known playback state without a COM call.
+
+        _state is written by start/pause/stop in the worker thread, and the
+        completion event by OnBufferEnd on the audio thread; both are single
+        reads under the GIL, so this is safe from any thread.
+        """
+        if self._callback.finished.is_set():
+            return PlaybackState.STOPPED
+        return self._state
+
+    def get_progress(self) -> tuple[int, int]:
+        """Get (samples_played, buffers_queued) from IXAudio2SourceVoice::GetState."""
+        if not self._this:
+            raise XAudio2Error("Voice pointer is NULL in get_progress (voice destroyed)")
+        self._get_state(self._this, self._state_buf_ref, 0)  # Flags
+        _, buffers_queued, samples_played = VOICE_STATE_STRUCT.unpack_from(self._state_buf)
+        return samples_played, buffers_queued
 
     def get_state(self) -> PlaybackState:
-        """Get current playback state."""
-        # Try to get voice state
-        GetStateFunc = CFUNCTYPE(
-            c_uint32, c_void_p, POINTER(XAUDIO2_VOICE_STATE), c_uint32
-        )
-        get_state_ptr = self._voice.lpVtbl.contents.GetState
-        if not get_state_ptr:
-            logger.warning("GetState vtable entry is NULL, using cached state")
-            return self._state
-            
-        get_state_func = cast(get_state_ptr, GetStateFunc)
-
-        state = XAUDIO2_VOICE_STATE()
-        hresult = get_state_func(self._voice_ptr, byref(state), 0)
-        if hresult >= 0:
-            # Log state for debugging (INFO level so it's always visible)
-            logger.info(
-                f"Voice get_state: BuffersQueued={state.BuffersQueued}, "
-                f"SamplesPlayed={state.SamplesPlayed}, "
-                f"cached_state={self._state}"
-            )
-            
-            # If BuffersQueued > 0, voice is active
-            if state.BuffersQueued > 0:
-                if self._state == PlaybackState.PAUSED:
-                    return PlaybackState.PAUSED
-                return PlaybackState.PLAYING
-            else:
-                # BuffersQueued == 0 means playback finished
-                if self._state == PlaybackState.PLAYING:
-                    logger.info("Voice finished: BuffersQueued == 0")
-                self._state = PlaybackState.STOPPED
-        else:
-            from xaudio2py.backends.xaudio2.utils import hr_to_hex
-            logger.warning(f"GetState failed with HRESULT {hr_to_hex(hresult)}, using cached state")
+        """
+        Get current playback state.
 
+        Completion is reported by the OnBufferEnd callback, so this no longer
+        polls GetState; use get_progress() for the device's queue counters.
+        """
+        if self._callback.finished.is_set() and self._state is not PlaybackState.STOPPED:
+            logger.debug("Voice finished: OnBufferEnd received")
+            self._state = PlaybackState.STOPPED
         return self._state
 
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the buffer has finished playing or was stopped."""
+        return self._callback.finished.wait(timeout)
+
     def destroy(self) -> None:
-        """Destroy the voice and free resources."""
-        # Get DestroyVoice function
-        DestroyVoiceFunc = CFUNCTYPE(None, c_void_p)
-        destroy_ptr = self._base_voice.lpVtbl.contents.DestroyVoice
-        destroy_func = cast(destroy_ptr, DestroyVoiceFunc)
+        """
+        Destroy the voice and free resources (idempotent).
 
-        destroy_func(self._voice_ptr)
+        DestroyVoice returns only after any callback in flight has finished,
+        so the callback can be released safely afterwards.
+        """
+        if not self._this:
+            return
+        self._destroy_voice(self._this)
+        self._this = 0
+        self._callback.release()
+        self._callback.finished.set()
+        self._audio_data = None
         logger.debug("SourceVoice: destroyed")
 
 
@@ -280,24 +408,20 @@ class MasteringVoice:
     def __init__(self, voice_ptr: c_void_p):
         """Initialize MasteringVoice wrapper."""
         self._voice_ptr = voice_ptr
+        self._this = voice_ptr.value if isinstance(voice_ptr, c_void_p) else int(voice_ptr)
         self._voice = cast(voice_ptr, POINTER(IXAudio2Voice)).contents
+        vtbl = self._voice.lpVtbl.contents
+        self._set_volume = cast(vtbl.SetVolume, _SET_VOLUME_PROTO)
+        self._destroy_voice = cast(vtbl.DestroyVoice, _DESTROY_VOICE_PROTO)
 
     def set_volume(self, volume: float) -> None:
         """Set master volume (0.0 to 1.0)."""
-        volume = max(0.0, min(1.0, volume))
+        volume = validate_volume(volume)
 
-        SetVolumeFunc = CFUNCTYPE(c_uint32, c_void_p, c_float, c_uint32)
-        set_volume_ptr = self._voice.lpVtbl.contents.SetVolume
-        set_volume_func = cast(set_volume_ptr, SetVolumeFunc)
-
-        hresult = set_volume_func(self._voice_ptr, c_float(volume), 0)
+        hresult = self._set_volume(self._this, volume, 0)
         hrcheck(hresult, "MasteringVoice SetVolume failed")
 
     def destroy(self) -> None:
         """Destroy mastering voice."""
-        DestroyVoiceFunc = CFUNCTYPE(None, c_void_p)
-        destroy_ptr = self._voice.lpVtbl.contents.DestroyVoice
-        destroy_func = cast(destroy_ptr, DestroyVoiceFunc)
-
-        destroy_func(self._voice_ptr)
+        self._destroy_voice(self._this)
 
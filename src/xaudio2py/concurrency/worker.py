@@ -1,10 +1,11 @@
 """Worker thread for backend command execution."""
 
-import queue
+import _thread
+import itertools
 import threading
-import uuid
-from dataclasses import dataclass
-from typing import Any, Callable, Optional, TypeVar
+import time
+from collections import deque
+from typing import Any, Callable, List, Optional, TypeVar
 from xaudio2py.core.interfaces import IAudioBackend, IBackendWorker
 from xaudio2py.utils.log import get_logger
 
@@ -12,16 +13,48 @@ logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+# Scheduled tasks run at most once per tick (matches the XAudio2 10 ms quantum)
+_TASK_TICK_NS = 10_000_000
+_TASK_TICK = _TASK_TICK_NS / 1e9
+
+# Commands run back to back before scheduled tasks get another look
+_MAX_BATCH = 32
+
 
-@dataclass
 class Command:
-    """Command to execute in worker thread."""
+    """
+    Command to execute in worker thread.
+
+    Instances are recycled per calling thread (see _acquire_command).
+    Completion is signalled through result_lock, a bare lock that is held
+    while the command is pending: the worker releases it when done and the
+    caller's acquire() both waits for that and re-arms it for the next use.
+    This is a single C-level lock, unlike threading.Event's Condition+lock.
+    """
+
+    __slots__ = ("id", "func", "args", "result_lock", "result", "error")
+
+    def __init__(self):
+        self.id = 0
+        self.func: Optional[Callable[..., Any]] = None
+        self.args: tuple = ()
+        self.result_lock = _thread.allocate_lock()
+        self.result_lock.acquire()
+        self.result: Optional[Any] = None
+        self.error: Optional[Exception] = None
+
+
+# One reusable Command per calling thread: execute() blocks until its command
+# completes, so a thread never has two in flight and a pool of one suffices
+_tls = threading.local()
 
-    id: str
-    func: Callable[[], T]
-    result_event: threading.Event
-    result: Optional[Any] = None
-    error: Optional[Exception] = None
+
+def _acquire_command() -> Command:
+    """Return the calling thread's Command, ready for reuse."""
+    cmd = getattr(_tls, "command", None)
+    if cmd is None:
+        cmd = _tls.command = Command()
+    return cmd
 
 
 class BackendWorker(IBackendWorker):
@@ -32,6 +65,8 @@ class BackendWorker(IBackendWorker):
     thread safety and proper initialization.
     
     This implementation uses threading.Event instead of sleep for synchronization.
+    Commands are handed over through a deque, whose append/popleft are atomic,
+    so submitting a command costs no lock beyond an occasional wake-up.
     """
 
     def __init__(self, backend: IAudioBackend):
@@ -42,11 +77,17 @@ class BackendWorker(IBackendWorker):
             backend: Audio backend implementation.
         """
         self.backend = backend
-        self._queue: queue.Queue[Optional[Command]] = queue.Queue()
+        self._queue: deque[Optional[Command]] = deque()
+        self._has_work = threading.Event()  # Set when the queue may be non-empty
         self._thread: Optional[threading.Thread] = None
+        self._worker_tid: Optional[int] = None  # ident of the worker thread
         self._stop_event = threading.Event()
         self._ready_event = threading.Event()  # Signals thread is ready
+        self._tasks: List[Callable[[int], bool]] = []  # Owned by worker thread
+        self._next_tick_ns = 0
         self._initialized = False
+        # Command ids for bookkeeping; next() on a count is atomic under the GIL
+        self._id_counter = itertools.count(1)
 
     def start(self) -> None:
         """
@@ -59,12 +100,14 @@ class BackendWorker(IBackendWorker):
 
         self._stop_event.clear()
         self._ready_event.clear()
+        self._tasks.clear()
         self._initialized = False
         
         # Use daemon thread to ensure it doesn't block program exit
         # Proper shutdown via stop() is still required for cleanup
         self._thread = threading.Thread(target=self._worker_loop, daemon=True)
         self._thread.start()
+        self._worker_tid = self._thread.ident
         
         # Wait for thread to be ready (using Event instead of sleep)
         if not self._ready_event.wait(timeout=5.0):
@@ -92,40 +135,31 @@ class BackendWorker(IBackendWorker):
         # Prevent new commands from being accepted
         self._initialized = False
         
-        # Signal stop - this will cause the thread to exit on next check
         self._stop_event.set()
         
-        # Send sentinel to wake up thread if it's waiting
-        try:
-            self._queue.put_nowait(None)
-        except queue.Full:
-            # Queue is full, thread should check stop_event anyway
-            pass
+        # The sentinel is what ends the loop: commands queued before it still run
+        self._submit(None)
         
         # Wait for thread to exit
         self._thread.join(timeout=5.0)
         if self._thread.is_alive():
-            logger.warning("Worker thread did not stop gracefully within timeout")
-            # Try one more sentinel
-            try:
-                self._queue.put_nowait(None)
-            except queue.Full:
-                pass
-            # Wait a bit more
-            self._thread.join(timeout=1.0)
-            if self._thread.is_alive():
-                logger.error("Worker thread still alive after timeout - may need manual cleanup")
-            self._thread = None
+            # A second sentinel would not help: the first one is already queued
+            logger.error("Worker thread still alive after timeout - may need manual cleanup")
         else:
             logger.info("Backend worker thread stopped")
-            self._thread = None
+        self._thread = None
+        self._worker_tid = None
 
-    def execute(self, func: Callable[[], T], timeout: Optional[float] = None) -> T:
+    def execute(
+        self, func: Callable[..., T], *args: Any, timeout: Optional[float] = None
+    ) -> T:
         """
         Execute a function in the worker thread and return result.
 
         Args:
-            func: Function to execute (no arguments).
+            func: Function to execute.
+            *args: Positional arguments passed to func. Prefer this over
+                wrapping the call in a lambda.
             timeout: Maximum time to wait for result (None = infinite).
 
         Returns:
@@ -139,21 +173,76 @@ class BackendWorker(IBackendWorker):
         if not self._initialized:
             raise RuntimeError("Worker thread not initialized")
 
-        cmd = Command(
-            id=str(uuid.uuid4()),
-            func=func,
-            result_event=threading.Event(),
-        )
+        # Already on the worker (nested command or scheduled task): queueing
+        # would deadlock waiting on ourselves, so just run it
+        if threading.get_ident() == self._worker_tid:
+            return func(*args)
+
+        cmd = _acquire_command()
+        cmd.id = next(self._id_counter)
+        cmd.func = func
+        cmd.args = args
 
-        self._queue.put(cmd)
+        self._submit(cmd)
 
-        if not cmd.result_event.wait(timeout=timeout):
+        completed = False
+        try:
+            completed = cmd.result_lock.acquire(timeout=-1 if timeout is None else timeout)
+        finally:
+            if not completed:
+                # Timed out or interrupted: the worker still owns the command
+                # and will release it later, so retire it from the pool
+                _tls.command = None
+        if not completed:
             raise TimeoutError(f"Command execution timeout after {timeout}s")
 
-        if cmd.error is not None:
-            raise cmd.error
+        result, error = cmd.result, cmd.error
+        # Drop references so the pooled command doesn't keep them alive
+        cmd.func = cmd.result = cmd.error = None
+        cmd.args = ()
 
-        return cmd.result
+        if error is not None:
+            raise error
+
+        return result
+
+    def schedule(self, task: Callable[[int], bool]) -> None:
+        """
+        Register a periodic task with the worker loop.
+
+        The task is called with time.monotonic_ns() once per tick and is
+        dropped as soon as it returns True (or raises). Must be called from
+        the worker thread, i.e. submitted via execute(worker.schedule, task).
+
+        Args:
+            task: Callable taking the current time in nanoseconds and
+                returning True when finished.
+        """
+        self._tasks.append(task)
+
+    def _run_tasks(self) -> None:
+        """Run scheduled tasks if a tick has elapsed."""
+        now = time.monotonic_ns()
+        if now < self._next_tick_ns:
+            return
+        self._next_tick_ns = now + _TASK_TICK_NS
+
+        remaining = []
+        for task in self._tasks:
+            try:
+                if not task(now):
+                    remaining.append(task)
+            except Exception:
+                logger.exception("Error in scheduled worker task")
+        self._tasks = remaining
+
+    def _submit(self, cmd: Optional[Command]) -> None:
+        """Enqueue a command (or the None sentinel) and wake the worker."""
+        self._queue.append(cmd)
+        # The worker clears the flag before re-checking the queue, so an
+        # already-set flag means this command will be seen without a wake-up.
+        if not self._has_work.is_set():
+            self._has_work.set()
 
     def _worker_loop(self) -> None:
         """Main worker loop."""
@@ -161,44 +250,49 @@ class BackendWorker(IBackendWorker):
         try:
             # Signal that thread is ready
             self._ready_event.set()
+            popleft = self._queue.popleft
             
-            while not self._stop_event.is_set():
-                try:
-                    # Use timeout to periodically check stop event
-                    cmd = self._queue.get(timeout=0.1)
-                    
-                    # Check stop event immediately after getting command
-                    if self._stop_event.is_set():
-                        logger.debug("Stop event set, exiting worker loop")
-                        if cmd is not None:
-                            # Put command back if possible (though we're exiting)
-                            pass
+            while True:
+                if self._tasks:
+                    self._run_tasks()
+
+                # Drain a burst of commands in one go
+                for _ in range(_MAX_BATCH):
+                    try:
+                        cmd = popleft()
+                    except IndexError:
                         break
-                    
+
                     if cmd is None:  # Sentinel
                         logger.debug("Received sentinel, exiting worker loop")
-                        break
+                        return
 
                     try:
-                        cmd.result = cmd.func()
+                        cmd.result = cmd.func(*cmd.args)
                     except Exception as e:
                         logger.exception("Error in worker thread command")
                         cmd.error = e
                     finally:
-                        cmd.result_event.set()
-                        self._queue.task_done()
-                    
-                    # Check stop event after command completion
-                    if self._stop_event.is_set():
-                        logger.debug("Stop event set after command, exiting worker loop")
-                        break
-                        
-                except queue.Empty:
-                    # Timeout - check stop event and continue loop
+                        cmd.result_lock.release()
+                else:
+                    # Batch full - more may be queued, so don't sleep
                     continue
 
+                # Queue drained - sleep until a producer signals. Only
+                # scheduled tasks need a timeout; stop() always wakes us
+                # with the sentinel.
+                self._has_work.wait(timeout=_TASK_TICK if self._tasks else None)
+                self._has_work.clear()
+
         except Exception as e:
             logger.exception("Fatal error in worker thread")
         finally:
+            # Fail commands that raced with stop() instead of leaving their
+            # callers blocked forever
+            while self._queue:
+                cmd = self._queue.popleft()
+                if cmd is not None:
+                    cmd.error = RuntimeError("Worker thread stopped")
+                    cmd.result_lock.release()
             logger.debug("Worker thread exiting")
 
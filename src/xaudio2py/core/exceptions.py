@@ -1,8 +1,16 @@
 """Exception classes for xaudio2py."""
 
+from functools import lru_cache
 
+
+@lru_cache(maxsize=256)
 def hr_to_hex(hr: int) -> str:
-    """Convert HRESULT to readable hex string (unsigned 32-bit)."""
+    """
+    Convert HRESULT to readable hex string (unsigned 32-bit).
+
+    Memoized: only a handful of distinct HRESULTs ever occur (mostly S_OK),
+    so repeat calls return the same string without formatting.
+    """
     return f"0x{(hr & 0xFFFFFFFF):08X}"
 
 
@@ -7,6 +7,9 @@ from xaudio2py.core.models import AudioFormat, SoundData, VoiceParams, PlaybackS
 class IVoice(Protocol):
     """Interface for an audio voice (playback instance)."""
 
+    # Empty so implementations may declare __slots__
+    __slots__ = ()
+
     def start(self) -> None:
         """Start playback."""
         ...
@@ -31,10 +34,57 @@ class IVoice(Protocol):
         """Set pan (-1.0 left, 0.0 center, 1.0 right)."""
         ...
 
+    def begin_batch(self, operation_set: int) -> None:
+        """
+        Defer subsequent set_volume/set_pan calls into an operation set.
+
+        Changes made until end_batch() are applied together, in a single
+        audio processing pass, when the batch is committed.
+
+        Args:
+            operation_set: Nonzero operation set identifier.
+        """
+        ...
+
+    def end_batch(self) -> None:
+        """Commit the current operation set and return to immediate mode."""
+        ...
+
     def get_state(self) -> PlaybackState:
         """Get current playback state."""
         ...
 
+    @property
+    def state(self) -> PlaybackState:
+        """
+        Last known playback state, safe to read from any thread.
+
+        Unlike get_state(), this does not query the device and therefore
+        does not have to run in the worker thread.
+        """
+        ...
+
+    def get_progress(self) -> tuple[int, int]:
+        """
+        Get playback progress as reported by the audio device.
+
+        Returns:
+            Tuple of (samples_played, buffers_queued). buffers_queued drops
+            to 0 once a non-looping buffer has been fully consumed.
+        """
+        ...
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until playback finishes or the voice is stopped.
+
+        Safe to call from any thread; must not require the worker thread.
+
+        Returns:
+            True if playback finished, False if the timeout expired.
+        """
+        ...
+
     def destroy(self) -> None:
         """Destroy the voice and free resources."""
         ...
@@ -43,6 +93,8 @@ class IVoice(Protocol):
 class IAudioBackend(Protocol):
     """Interface for audio backend implementation."""
 
+    __slots__ = ()
+
     def initialize(self) -> None:
         """Initialize the backend (called in worker thread)."""
         ...
@@ -73,8 +125,12 @@ class IBackendWorker(Protocol):
         """Stop the worker thread (blocks until done)."""
         ...
 
-    def execute(self, command, timeout: Optional[float] = None):
-        """Execute a command in the worker thread and return result."""
+    def execute(self, command, *args, timeout: Optional[float] = None):
+        """Execute command(*args) in the worker thread and return result."""
+        ...
+
+    def schedule(self, task) -> None:
+        """Register a periodic task(now_ns) -> done run by the worker loop."""
         ...
 
 
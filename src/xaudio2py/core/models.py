@@ -1,21 +1,22 @@
 """Data models and configuration classes."""
 
+import mmap
 from dataclasses import dataclass
-from enum import Enum
-from typing import Optional
+from enum import IntEnum
+from typing import Optional, Union
 
 
-class PlaybackState(Enum):
-    """Playback state enumeration."""
+class PlaybackState(IntEnum):
+    """Playback state enumeration (members are singletons; compare with ``is``)."""
 
-    STOPPED = "stopped"
-    PLAYING = "playing"
-    PAUSED = "paused"
+    STOPPED = 0
+    PLAYING = 1
+    PAUSED = 2
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EngineConfig:
-    """Configuration for AudioEngine."""
+    """Configuration for AudioEngine (immutable, safe to share)."""
 
     sample_rate: int = 48000
     """Target sample rate (Hz). Default: 48000."""
@@ -27,9 +28,9 @@ class EngineConfig:
     """Bits per sample. Default: 16."""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AudioFormat:
-    """Audio format specification."""
+    """Audio format specification (immutable)."""
 
     sample_rate: int
     """Sample rate in Hz."""
@@ -57,15 +58,22 @@ class AudioFormat:
         return self.bits_per_sample // 8
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SoundData:
-    """Loaded audio data."""
+    """Loaded audio data (immutable, shared by every playback of a sound)."""
 
     format: AudioFormat
     """Audio format specification."""
 
-    data: bytes
-    """Raw PCM audio data."""
+    data: Union[bytes, memoryview]
+    """
+    Raw PCM audio data.
+
+    bytes for small files and decoded audio; a memoryview over a memory-mapped
+    file for WAV files of 64 KiB and more and for MP3 cache hits. Convert with
+    bytes(data) before hashing or concatenating. Mapped data keeps the file
+    open (and locked on Windows) until close() or garbage collection.
+    """
 
     duration_seconds: float
     """Duration in seconds."""
@@ -75,10 +83,32 @@ class SoundData:
         """Number of audio frames."""
         return len(self.data) // self.format.frame_size
 
-
-@dataclass
+    def close(self) -> None:
+        """
+        Unmap memory-mapped data now instead of at garbage collection.
+
+        A no-op for bytes; safe to call more than once. The data must not be
+        used afterwards. If a playback still uses it, the mapping is released
+        once that playback's voice is destroyed instead.
+        """
+        data = self.data
+        if not isinstance(data, memoryview):
+            return
+        try:
+            mapped = data.obj
+        except ValueError:
+            return  # Already released
+        data.release()
+        if isinstance(mapped, mmap.mmap):
+            try:
+                mapped.close()
+            except BufferError:
+                pass  # Still pinned by a voice buffer; freed along with it
+
+
+@dataclass(slots=True)
 class VoiceParams:
-    """Parameters for voice creation."""
+    """Parameters for voice creation (updated in place by volume/pan changes)."""
 
     volume: float = 1.0
     """Volume (0.0 to 1.0)."""
@@ -1,22 +1,24 @@
 """Playback registry for tracking active playbacks."""
 
+import threading
 import time
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 from xaudio2py.api.sound import PlaybackHandle, Sound
 from xaudio2py.core.interfaces import IVoice
 from xaudio2py.core.models import PlaybackState, VoiceParams
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaybackInfo:
-    """Information about an active playback."""
+    """Information about an active playback (one per playing voice)."""
     
     handle: PlaybackHandle
     voice: IVoice
     sound: Sound
     params: VoiceParams
-    start_time: float
+    start_time: int
+    """time.perf_counter_ns() at registration."""
 
 
 class PlaybackRegistry:
@@ -27,11 +29,16 @@ class PlaybackRegistry:
     - Store and retrieve playback information
     - Track playback lifecycle
     - Provide thread-safe access to playback data
+    
+    The playback dict is copy-on-write: writers build a new dict under a
+    lock and swap it in, so readers (get, iteration) never lock and never
+    see a dict change size under them.
     """
     
     def __init__(self):
         """Initialize the registry."""
-        self._playbacks: Dict[str, PlaybackInfo] = {}
+        self._playbacks: Dict[int, PlaybackInfo] = {}
+        self._lock = threading.RLock()
     
     def register(
         self,
@@ -54,9 +61,12 @@ class PlaybackRegistry:
             voice=voice,
             sound=sound,
             params=params,
-            start_time=time.monotonic(),
+            start_time=time.perf_counter_ns(),
         )
-        self._playbacks[handle.id] = playback_info
+        with self._lock:
+            playbacks = dict(self._playbacks)
+            playbacks[handle.id] = playback_info
+            self._playbacks = playbacks
     
     def get(self, handle: PlaybackHandle) -> Optional[PlaybackInfo]:
         """
@@ -77,7 +87,12 @@ class PlaybackRegistry:
         Args:
             handle: Playback handle.
         """
-        self._playbacks.pop(handle.id, None)
+        with self._lock:
+            if handle.id not in self._playbacks:
+                return
+            playbacks = dict(self._playbacks)
+            del playbacks[handle.id]
+            self._playbacks = playbacks
     
     def get_all_handles(self) -> list[PlaybackHandle]:
         """
@@ -86,11 +101,45 @@ class PlaybackRegistry:
         Returns:
             List of all active handles.
         """
-        return [info.handle for info in self._playbacks.values()]
+        return list(self.iter_handles())
+    
+    def iter_handles(self) -> Iterator[PlaybackHandle]:
+        """
+        Iterate over active playback handles without building a list.
+        
+        Returns:
+            Iterator over all active handles.
+        """
+        return (info.handle for info in self._playbacks.values())
+    
+    def iter_voices(self) -> Iterator[IVoice]:
+        """
+        Iterate over the voices of all active playbacks.
+        
+        For bulk voice operations (pause-all, stop-all) that would otherwise
+        look each handle up again.
+        
+        Returns:
+            Iterator over all active voices.
+        """
+        return (info.voice for info in self._playbacks.values())
+    
+    def get_all_infos(self) -> list[PlaybackInfo]:
+        """
+        Get a snapshot of all active playback records.
+        
+        Lets callers that touch every playback (e.g. stop_all) work on the
+        records directly instead of re-looking each handle up.
+        
+        Returns:
+            List of all active PlaybackInfo records.
+        """
+        return list(self._playbacks.values())
     
     def clear(self) -> None:
         """Clear all playbacks from registry."""
-        self._playbacks.clear()
+        with self._lock:
+            self._playbacks = {}
     
     def count(self) -> int:
         """
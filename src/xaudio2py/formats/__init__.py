@@ -1,9 +1,8 @@
 """Audio format parsers with automatic registration."""
 
 import importlib
-import pkgutil
-from pathlib import Path
-from typing import Dict, Optional
+import os
+from typing import Dict, Optional, Set
 from xaudio2py.core.exceptions import AudioFormatError, InvalidAudioFormat
 from xaudio2py.core.interfaces import IAudioFormat
 from xaudio2py.utils.log import get_logger
@@ -13,6 +12,15 @@ logger = get_logger(__name__)
 # Registry of all available formats
 _format_registry: Dict[str, IAudioFormat] = {}
 
+# Format modules are imported on first use of one of their extensions, so
+# playing WAV files never imports the MP3 decoder
+_FORMAT_MODULES: Dict[str, str] = {
+    ".wav": "xaudio2py.formats.wav",
+    ".wave": "xaudio2py.formats.wav",
+    ".mp3": "xaudio2py.formats.mp3",
+}
+_loaded_modules: Set[str] = set()
+
 
 def _register_format(format: IAudioFormat) -> None:
     """
@@ -25,37 +33,47 @@ def _register_format(format: IAudioFormat) -> None:
         ext_lower = ext.lower()
         if ext_lower in _format_registry:
             logger.warning(
-                f"Format with extension {ext_lower} already registered, "
-                f"overwriting with {type(format).__name__}"
+                "Format with extension %s already registered, overwriting with %s",
+                ext_lower,
+                type(format).__name__,
             )
         _format_registry[ext_lower] = format
-    logger.debug(f"Registered format {type(format).__name__} for extensions: {format.extensions}")
-
-
-def _auto_discover_formats() -> None:
-    """Automatically discover and register all format implementations in this package."""
-    # Try to discover additional formats in this package
-    package_path = Path(__file__).parent
-    for module_info in pkgutil.iter_modules([str(package_path)]):
-        module_name = module_info.name
-        # Skip __init__
-        if module_name == "__init__":
-            continue
-        
-        try:
-            module = importlib.import_module(f"xaudio2py.formats.{module_name}")
-            # Look for format instances (variables ending with _format)
-            for attr_name in dir(module):
-                if attr_name.endswith("_format") and not attr_name.startswith("_"):
-                    try:
-                        attr = getattr(module, attr_name)
-                        if isinstance(attr, IAudioFormat):
-                            _register_format(attr)
-                            logger.info(f"Auto-discovered format from {module_name}: {type(attr).__name__}")
-                    except Exception as e:
-                        logger.debug(f"Could not register format {attr_name} from {module_name}: {e}")
-        except Exception as e:
-            logger.debug(f"Could not load format module {module_name}: {e}")
+    logger.debug("Registered format %s for extensions: %s", type(format).__name__, format.extensions)
+
+
+def _load_format_module(module_name: str) -> None:
+    """
+    Import a format module and register the format instances it exposes.
+
+    Format instances are module-level variables whose names end with
+    ``_format`` (e.g. ``wav_format``).
+
+    Args:
+        module_name: Fully qualified module name.
+    """
+    if module_name in _loaded_modules:
+        return
+    _loaded_modules.add(module_name)
+
+    try:
+        module = importlib.import_module(module_name)
+    except Exception as e:
+        logger.debug("Could not load format module %s: %s", module_name, e)
+        return
+
+    for attr_name in dir(module):
+        if attr_name.endswith("_format") and not attr_name.startswith("_"):
+            attr = getattr(module, attr_name)
+            # IAudioFormat is not runtime_checkable, so isinstance() can't be
+            # used; formats subclass it explicitly
+            if IAudioFormat in type(attr).__mro__:
+                _register_format(attr)
+
+
+def _load_all_formats() -> None:
+    """Import every known format module (used for unknown extensions)."""
+    for module_name in dict.fromkeys(_FORMAT_MODULES.values()):
+        _load_format_module(module_name)
 
 
 def get_format_for_file(path: str) -> Optional[IAudioFormat]:
@@ -68,21 +86,21 @@ def get_format_for_file(path: str) -> Optional[IAudioFormat]:
     Returns:
         IAudioFormat instance if a suitable format is found, None otherwise.
     """
-    if not _format_registry:
-        _auto_discover_formats()
+    ext = os.path.splitext(path)[1].lower()
     
-    path_obj = Path(path)
-    ext = path_obj.suffix.lower()
+    module_name = _FORMAT_MODULES.get(ext)
+    if module_name is not None:
+        _load_format_module(module_name)
     
     # First try by extension
-    if ext in _format_registry:
-        format = _format_registry[ext]
-        if format.can_load(path):
-            return format
+    by_ext = _format_registry.get(ext)
+    if by_ext is not None and by_ext.can_load(path):
+        return by_ext
     
-    # If extension-based lookup fails, try all formats
-    for format in _format_registry.values():
-        if format.can_load(path):
+    # If extension-based lookup fails, try the remaining formats
+    _load_all_formats()
+    for format in dict.fromkeys(_format_registry.values()):
+        if format is not by_ext and format.can_load(path):
             return format
     
     return None
@@ -106,32 +124,11 @@ def load_audio(path: str):
     if format is None:
         raise AudioFormatError(
             f"No suitable format handler found for file: {path}. "
-            f"Supported extensions: {', '.join(sorted(set(ext for fmt in _format_registry.values() for ext in fmt.extensions)))}"
+            f"Supported extensions: {', '.join(sorted(_format_registry))}"
         )
     
     return format.load(path)
 
 
-# Initialize registry on import
-# Auto-discovery should find and register all formats
-_auto_discover_formats()
-
-# If registry is still empty after auto-discovery, explicitly try to import known formats
-# This handles edge cases where pkgutil.iter_modules might not work correctly
-if not _format_registry:
-    try:
-        from xaudio2py.formats import wav
-        if hasattr(wav, 'wav_format'):
-            _register_format(wav.wav_format)
-    except ImportError:
-        pass
-    
-    try:
-        from xaudio2py.formats import mp3
-        if hasattr(mp3, 'mp3_format'):
-            _register_format(mp3.mp3_format)
-    except ImportError:
-        pass  # mp3 may not be available if pydub is missing
-
 __all__ = ["load_audio", "get_format_for_file", "IAudioFormat"]
 
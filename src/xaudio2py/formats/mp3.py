@@ -1,6 +1,12 @@
 """MP3 file parser and decoder."""
 
+import json
+import mmap
+import os
+import sys
+from hashlib import blake2b
 from pathlib import Path
+from typing import Optional
 from xaudio2py.core.exceptions import InvalidAudioFormat
 from xaudio2py.core.interfaces import IAudioFormat
 from xaudio2py.core.models import AudioFormat, SoundData
@@ -8,13 +14,229 @@ from xaudio2py.utils.log import get_logger
 
 logger = get_logger(__name__)
 
-try:
-    from pydub import AudioSegment
-    PYDUB_AVAILABLE = True
-    PYDUB_ERROR = None
-except ImportError as e:
-    PYDUB_AVAILABLE = False
-    PYDUB_ERROR = str(e)
+# Sample rates the XAudio2 backend accepts; other rates are resampled
+_SUPPORTED_RATES = (44100, 48000)
+
+# Opt-in disk cache of decoded PCM, stored as <key>.pcm + <key>.json.
+# XAUDIO2PY_MP3_CACHE: unset/"0" disables it, "1" uses the default
+# directory, anything else is the cache directory itself.
+_CACHE_ENV = "XAUDIO2PY_MP3_CACHE"
+# XAUDIO2PY_MP3_CACHE_MAX_MB: size limit; least recently used entries go first
+_CACHE_MAX_ENV = "XAUDIO2PY_MP3_CACHE_MAX_MB"
+_DEFAULT_CACHE_MAX_MB = 512
+
+
+def _default_cache_dir() -> Path:
+    """Per-user cache location (%LOCALAPPDATA% on Windows, XDG elsewhere)."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "xaudio2py" / "mp3"
+
+
+def _cache_dir() -> Optional[Path]:
+    """Cache directory selected by XAUDIO2PY_MP3_CACHE, or None if disabled."""
+    value = os.environ.get(_CACHE_ENV, "").strip()
+    if value in ("", "0"):
+        return None
+    if value == "1":
+        return _default_cache_dir()
+    return Path(value).expanduser()
+
+
+def _cache_max_bytes() -> int:
+    """Cache size limit from XAUDIO2PY_MP3_CACHE_MAX_MB."""
+    value = os.environ.get(_CACHE_MAX_ENV)
+    if value:
+        try:
+            return int(float(value) * 1024 * 1024)
+        except ValueError:
+            logger.warning("Ignoring invalid %s=%r", _CACHE_MAX_ENV, value)
+    return _DEFAULT_CACHE_MAX_MB * 1024 * 1024
+
+
+def _cache_key(path: str, st: os.stat_result) -> str:
+    """Cache key for a source file; changes whenever the file is modified."""
+    source = f"{os.path.abspath(path)}|{st.st_mtime_ns}|{st.st_size}"
+    return blake2b(source.encode(), digest_size=16).hexdigest()
+
+
+def _cache_load(cache_dir: Path, key: str) -> Optional[SoundData]:
+    """
+    Load previously decoded PCM from the disk cache.
+
+    The PCM file is memory-mapped copy-on-write, so repeat loads skip
+    decoding entirely and the pages are shared with other processes.
+
+    Returns:
+        SoundData, or None on a cache miss or an unreadable entry.
+    """
+    pcm_path = cache_dir / f"{key}.pcm"
+    try:
+        with open(cache_dir / f"{key}.json", encoding="utf-8") as f:
+            header = json.load(f)
+        format = AudioFormat(**header["format"])
+        with open(pcm_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                data = b""
+            else:
+                # Same type as the WAV loader's mapped data
+                data = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY))
+        duration_seconds = header["duration_seconds"]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning("Ignoring broken MP3 cache entry %s: %s", key, e)
+        return None
+    # Eviction drops the oldest mtime first, so a hit marks the entry as used
+    try:
+        os.utime(pcm_path)
+    except OSError:
+        pass
+    logger.debug("MP3 cache hit: %s", key)
+    return SoundData(format=format, data=data, duration_seconds=duration_seconds)
+
+
+def _cache_store(cache_dir: Path, key: str, sound: SoundData, max_bytes: int) -> None:
+    """Write decoded PCM to the disk cache (atomically; errors are logged)."""
+    if len(sound.data) > max_bytes:
+        logger.debug("MP3 cache: %s is larger than the cache limit, not stored", key)
+        return
+    header = {
+        "format": {
+            "sample_rate": sound.format.sample_rate,
+            "channels": sound.format.channels,
+            "bits_per_sample": sound.format.bits_per_sample,
+            "block_align": sound.format.block_align,
+            "avg_bytes_per_sec": sound.format.avg_bytes_per_sec,
+        },
+        "duration_seconds": sound.duration_seconds,
+    }
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # PCM first: a .json without its .pcm is never visible
+        for suffix, mode, payload in (
+            (".pcm", "wb", sound.data),
+            (".json", "w", json.dumps(header)),
+        ):
+            target = cache_dir / f"{key}{suffix}"
+            tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            with open(tmp, mode) as f:
+                f.write(payload)
+            os.replace(tmp, target)
+    except OSError as e:
+        logger.warning("Failed to write MP3 cache entry %s: %s", key, e)
+        return
+    _cache_evict(cache_dir, max_bytes)
+
+
+def _cache_evict(cache_dir: Path, max_bytes: int) -> None:
+    """Delete least recently used entries until the PCM files fit in max_bytes."""
+    entries = []
+    total = 0
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".pcm"):
+                    st = entry.stat()
+                    entries.append((st.st_mtime_ns, entry.name[:-4], st.st_size))
+                    total += st.st_size
+    except OSError as e:
+        logger.warning("Failed to scan MP3 cache %s: %s", cache_dir, e)
+        return
+
+    entries.sort()
+    for _, key, size in entries:
+        if total <= max_bytes:
+            break
+        try:
+            # Without its .pcm the entry is a miss, so the .json may linger
+            os.remove(cache_dir / f"{key}.pcm")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            # e.g. still memory-mapped by a loaded Sound on Windows
+            logger.debug("Could not evict MP3 cache entry %s: %s", key, e)
+            continue
+        try:
+            os.remove(cache_dir / f"{key}.json")
+        except OSError:
+            pass
+        total -= size
+        logger.debug("Evicted MP3 cache entry %s", key)
+
+
+def _import_miniaudio():
+    """
+    Import miniaudio if available.
+
+    miniaudio decodes MP3 in-process, so it is preferred over pydub, which
+    spawns ffmpeg and round-trips through a temporary WAV file.
+
+    Returns:
+        The miniaudio module, or None if it is not installed.
+    """
+    try:
+        import miniaudio
+    except ImportError:
+        return None
+    return miniaudio
+
+
+def _target_rate(rate: int) -> int:
+    """Return rate if supported, otherwise the closest supported rate."""
+    if rate in _SUPPORTED_RATES:
+        return rate
+    return 44100 if abs(rate - 44100) < abs(rate - 48000) else 48000
+
+
+def _make_sound_data(
+    raw_audio: bytes, channels: int, sample_rate: int, duration_seconds: float
+) -> SoundData:
+    """Wrap decoded 16-bit PCM in SoundData."""
+    block_align = channels * 2
+    format = AudioFormat(
+        sample_rate=sample_rate,
+        channels=channels,
+        bits_per_sample=16,
+        block_align=block_align,
+        avg_bytes_per_sec=sample_rate * block_align,
+    )
+    return SoundData(format=format, data=raw_audio, duration_seconds=duration_seconds)
+
+
+def _import_audio_segment():
+    """
+    Import pydub's AudioSegment on first MP3 load.
+
+    Only used when miniaudio is not installed. pydub is optional and slow
+    to import, so it is not imported together with this module (itself
+    only loaded on the first .mp3 lookup). Subsequent calls hit the
+    sys.modules cache.
+
+    Raises:
+        ImportError: If pydub (or its audioop dependency) is missing.
+    """
+    try:
+        from pydub import AudioSegment
+    except ImportError as e:
+        error = str(e)
+        error_msg = "miniaudio or pydub is required for MP3 support."
+        # Check for common missing dependency issues
+        if "audioop" in error.lower() or "pyaudioop" in error.lower():
+            error_msg += (
+                "\n\npydub is installed but missing the 'audioop' module. "
+                "This is common on Python 3.13+ where audioop was removed. "
+                "Install audioop-lts to fix this:\n"
+                "  pip install audioop-lts"
+            )
+        elif getattr(e, "name", None) == "pydub":
+            error_msg += " Install it with: pip install miniaudio"
+        else:
+            error_msg += f"\n\nImport error: {error}"
+        raise ImportError(error_msg) from e
+    return AudioSegment
 
 
 class Mp3Format(IAudioFormat):
@@ -27,13 +249,10 @@ class Mp3Format(IAudioFormat):
 
     def can_load(self, path: str) -> bool:
         """Check if file can be loaded as MP3."""
-        path_obj = Path(path)
-        if not path_obj.exists():
-            return False
-        
-        # Check extension - if it's .mp3, we can try to load it
-        # The actual validation (including pydub availability) will happen in load()
-        return path_obj.suffix.lower() in self.extensions
+        # Extension only: load() stats the file anyway (for the cache key)
+        # and raises FileNotFoundError there, so checking here would just
+        # add a second stat per load
+        return os.path.splitext(path)[1].lower() in self.extensions
 
     def load(self, path: str) -> SoundData:
         """
@@ -54,32 +273,71 @@ class Mp3Format(IAudioFormat):
         Raises:
             InvalidAudioFormat: If format cannot be decoded or converted.
             FileNotFoundError: If file does not exist.
-            ImportError: If pydub is not installed.
+            ImportError: If neither miniaudio nor pydub is installed.
         """
-        if not PYDUB_AVAILABLE:
-            error_msg = "pydub is required for MP3 support."
-            if PYDUB_ERROR:
-                # Check for common missing dependency issues
-                if "audioop" in PYDUB_ERROR.lower() or "pyaudioop" in PYDUB_ERROR.lower():
-                    error_msg += (
-                        "\n\npydub is installed but missing the 'audioop' module. "
-                        "This is common on Python 3.13+ where audioop was removed. "
-                        "Install audioop-lts to fix this:\n"
-                        "  pip install audioop-lts"
-                    )
-                else:
-                    error_msg += f"\n\nImport error: {PYDUB_ERROR}"
-            else:
-                error_msg += " Install it with: pip install pydub"
-            raise ImportError(error_msg)
-
-        path_obj = Path(path)
-        if not path_obj.exists():
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"MP3 file not found: {path}")
 
+        cache_dir = _cache_dir()
+        if cache_dir is not None:
+            key = _cache_key(path, st)
+            sound = _cache_load(cache_dir, key)
+            if sound is not None:
+                return sound
+
+        miniaudio = _import_miniaudio()
+        if miniaudio is not None:
+            sound = self._load_miniaudio(miniaudio, path)
+        else:
+            sound = self._load_pydub(path)
+        if cache_dir is not None:
+            _cache_store(cache_dir, key, sound, _cache_max_bytes())
+        return sound
+
+    def _load_miniaudio(self, miniaudio, path: str) -> SoundData:
+        """Decode in-process with miniaudio (no ffmpeg, no temp files)."""
+        try:
+            info = miniaudio.mp3_get_file_info(path)
+            channels = info.nchannels if info.nchannels in (1, 2) else 2
+            sample_rate = _target_rate(info.sample_rate)
+            if sample_rate != info.sample_rate:
+                logger.info(
+                    "Resampling MP3 from %d Hz to %d Hz", info.sample_rate, sample_rate
+                )
+            # Channel conversion and resampling happen inside the decoder
+            decoded = miniaudio.decode_file(
+                path,
+                output_format=miniaudio.SampleFormat.SIGNED16,
+                nchannels=channels,
+                sample_rate=sample_rate,
+            )
+        except miniaudio.MiniaudioError as e:
+            raise InvalidAudioFormat(f"Failed to decode MP3 file: {e}")
+
+        duration_seconds = decoded.num_frames / decoded.sample_rate
+        logger.info(
+            "Loaded MP3: %dch, %dHz, 16bit, %.2fs (original: %dHz)",
+            decoded.nchannels,
+            decoded.sample_rate,
+            duration_seconds,
+            info.sample_rate,
+        )
+        return _make_sound_data(
+            decoded.samples.tobytes(),
+            decoded.nchannels,
+            decoded.sample_rate,
+            duration_seconds,
+        )
+
+    def _load_pydub(self, path: str) -> SoundData:
+        """Decode with pydub (spawns ffmpeg); fallback when miniaudio is missing."""
+        AudioSegment = _import_audio_segment()
+
         try:
             # Load MP3 using pydub
-            audio = AudioSegment.from_mp3(str(path_obj))
+            audio = AudioSegment.from_mp3(path)
             
             # Convert to required format
             # Ensure 16-bit
@@ -91,16 +349,16 @@ class Mp3Format(IAudioFormat):
                 # Convert to stereo if more than 2 channels
                 audio = audio.set_channels(2)
                 logger.warning(
-                    f"MP3 has {audio.channels} channels, converting to stereo"
+                    "MP3 has %d channels, converting to stereo", audio.channels
                 )
             
             # Resample to supported sample rate (44100 or 48000)
             original_rate = audio.frame_rate
-            if original_rate not in (44100, 48000):
+            if original_rate not in _SUPPORTED_RATES:
                 # Choose closest supported rate
-                target_rate = 44100 if abs(original_rate - 44100) < abs(original_rate - 48000) else 48000
+                target_rate = _target_rate(original_rate)
                 logger.info(
-                    f"Resampling MP3 from {original_rate} Hz to {target_rate} Hz"
+                    "Resampling MP3 from %d Hz to %d Hz", original_rate, target_rate
                 )
                 audio = audio.set_frame_rate(target_rate)
                 sample_rate = target_rate
@@ -128,8 +386,12 @@ class Mp3Format(IAudioFormat):
             duration_seconds = len(audio) / 1000.0  # pydub returns duration in milliseconds
             
             logger.info(
-                f"Loaded MP3: {num_channels}ch, {sample_rate}Hz, {bits_per_sample}bit, "
-                f"{duration_seconds:.2f}s (original: {original_rate}Hz)"
+                "Loaded MP3: %dch, %dHz, %dbit, %.2fs (original: %dHz)",
+                num_channels,
+                sample_rate,
+                bits_per_sample,
+                duration_seconds,
+                original_rate,
             )
             
             return SoundData(
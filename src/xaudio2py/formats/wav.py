@@ -1,8 +1,9 @@
 """RIFF WAV file parser."""
 
+import mmap
+import os
 import struct
-from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, Union
 from xaudio2py.core.exceptions import AudioFormatError, InvalidAudioFormat
 from xaudio2py.core.interfaces import IAudioFormat
 from xaudio2py.core.models import AudioFormat, SoundData
@@ -10,6 +11,25 @@ from xaudio2py.utils.log import get_logger
 
 logger = get_logger(__name__)
 
+# Pre-compiled header layouts (little-endian)
+_RIFF_HDR = struct.Struct("<4sI4s")  # "RIFF", file size, "WAVE"
+_CHUNK_HDR = struct.Struct("<4sI")  # chunk id, chunk size
+# audio_format, num_channels, sample_rate, byte_rate, block_align, bits_per_sample
+_FMT_STRUCT = struct.Struct("<HHIIHH")
+
+_EXTENSIONS = frozenset((".wav", ".wave"))
+
+# What the XAudio2 backend can play
+_SUPPORTED_BPS = 16
+_VALID_CHANNELS = frozenset((1, 2))
+_VALID_RATES = frozenset((44100, 48000))
+
+# Chunks the parser keeps; any other chunk id is skipped
+_WANTED_CHUNKS = frozenset((b"fmt ", b"data"))
+
+# Files at least this big are memory-mapped instead of read into memory
+_MMAP_THRESHOLD = 64 * 1024
+
 
 class WavFormat(IAudioFormat):
     """WAV format parser implementing IAudioFormat."""
@@ -21,25 +41,18 @@ class WavFormat(IAudioFormat):
 
     def can_load(self, path: str) -> bool:
         """Check if file can be loaded as WAV."""
-        path_obj = Path(path)
-        if not path_obj.exists():
-            return False
-        
         # Check extension
-        if path_obj.suffix.lower() not in self.extensions:
+        if os.path.splitext(path)[1].lower() not in _EXTENSIONS:
             return False
         
-        # Check file header (RIFF WAVE)
+        # Check file header (RIFF WAVE) with a single read; a missing file
+        # fails the open
         try:
-            with open(path_obj, "rb") as f:
-                riff = f.read(4)
-                if riff != b"RIFF":
-                    return False
-                f.seek(8)  # Skip file size
-                wave = f.read(4)
-                return wave == b"WAVE"
-        except Exception:
+            with open(path, "rb") as f:
+                head = f.read(12)
+        except OSError:
             return False
+        return len(head) == 12 and head[:4] == b"RIFF" and head[8:12] == b"WAVE"
 
     def load(self, path: str) -> SoundData:
         """
@@ -62,65 +75,97 @@ class WavFormat(IAudioFormat):
             FileNotFoundError: If file does not exist.
             IOError: If file cannot be read.
         """
-        path_obj = Path(path)
-        if not path_obj.exists():
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
             raise FileNotFoundError(f"WAV file not found: {path}")
 
-        with open(path_obj, "rb") as f:
-            return _parse_wav(f)
+        with f:
+            if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+                return _parse_wav(f)
+            # Copy-on-write mapping: pages are shared with the page cache, and
+            # it is writable, so the backend can wrap it without copying
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        # The data view keeps the mapping alive for as long as the sound lives
+        return _parse_wav_buffer(memoryview(mapped))
+
+    def load_bytes(self, raw: bytes) -> SoundData:
+        """
+        Parse an in-memory WAV file and return SoundData.
+
+        Args:
+            raw: Complete WAV file contents.
+
+        Returns:
+            SoundData with format and PCM data.
+
+        Raises:
+            InvalidAudioFormat: If format is not supported.
+        """
+        return _parse_wav_buffer(raw)
 
 
 def _parse_wav(f: BinaryIO) -> SoundData:
     """Parse WAV file from file handle."""
+    return _parse_wav_buffer(f.read())
+
+
+def _parse_wav_buffer(buf: Union[bytes, memoryview]) -> SoundData:
+    """
+    Parse a complete WAV file held in memory.
+
+    Chunks are located by offset arithmetic, and the data chunk is a slice
+    of buf: a copy for bytes, a zero-copy view for a memoryview.
+    """
+    size = len(buf)
     # Read RIFF header
-    riff = f.read(4)
-    if riff != b"RIFF":
+    if size < _RIFF_HDR.size:
         raise InvalidAudioFormat("Not a RIFF file")
 
-    file_size = struct.unpack("<I", f.read(4))[0]
-
-    wave = f.read(4)
+    riff, file_size, wave = _RIFF_HDR.unpack_from(buf, 0)
+    if riff != b"RIFF":
+        raise InvalidAudioFormat("Not a RIFF file")
     if wave != b"WAVE":
         raise InvalidAudioFormat("Not a WAVE file")
 
-    # Read chunks
-    fmt_data = None
-    data_chunk = None
+    # Read chunks, in any order, until every wanted chunk has been seen;
+    # each is recorded as (offset, size) so nothing is sliced until needed
+    chunks = {}
+    offset = _RIFF_HDR.size
 
-    while True:
-        chunk_id = f.read(4)
-        if len(chunk_id) < 4:
-            break
+    while offset + _CHUNK_HDR.size <= size and len(chunks) < len(_WANTED_CHUNKS):
+        chunk_id, chunk_size = _CHUNK_HDR.unpack_from(buf, offset)
+        offset += _CHUNK_HDR.size
 
-        chunk_size = struct.unpack("<I", f.read(4))[0]
+        if chunk_id in _WANTED_CHUNKS:
+            # Clip to the buffer, as a truncated read would
+            chunks.setdefault(chunk_id, (offset, min(chunk_size, size - offset)))
+        # Skip to the next chunk (chunks are padded to an even size)
+        offset += chunk_size + (chunk_size & 1)
 
-        if chunk_id == b"fmt ":
-            fmt_data = f.read(chunk_size)
-        elif chunk_id == b"data":
-            data_chunk = f.read(chunk_size)
-            break
-        else:
-            # Skip unknown chunks
-            f.seek(chunk_size, 1)
+    fmt_range = chunks.get(b"fmt ")
+    data_range = chunks.get(b"data")
 
-    if fmt_data is None:
+    if fmt_range is None:
         raise InvalidAudioFormat("Missing fmt chunk")
 
-    if data_chunk is None:
+    if data_range is None:
         raise InvalidAudioFormat("Missing data chunk")
 
-    # Parse fmt chunk
-    # Format: audio_format(2), num_channels(2), sample_rate(4),
-    #         byte_rate(4), block_align(2), bits_per_sample(2)
-    if len(fmt_data) < 16:
+    # Parse fmt chunk in place
+    fmt_offset, fmt_size = fmt_range
+    if fmt_size < _FMT_STRUCT.size:
         raise InvalidAudioFormat("Invalid fmt chunk size")
 
-    audio_format = struct.unpack("<H", fmt_data[0:2])[0]
-    num_channels = struct.unpack("<H", fmt_data[2:4])[0]
-    sample_rate = struct.unpack("<I", fmt_data[4:8])[0]
-    byte_rate = struct.unpack("<I", fmt_data[8:12])[0]
-    block_align = struct.unpack("<H", fmt_data[12:14])[0]
-    bits_per_sample = struct.unpack("<H", fmt_data[14:16])[0]
+    (
+        audio_format,
+        num_channels,
+        sample_rate,
+        byte_rate,
+        block_align,
+        bits_per_sample,
+    ) = _FMT_STRUCT.unpack_from(buf, fmt_offset)
 
     # Validate format
     if audio_format != 1:  # PCM
@@ -128,17 +173,17 @@ def _parse_wav(f: BinaryIO) -> SoundData:
             f"Unsupported audio format: {audio_format} (only PCM=1 is supported)"
         )
 
-    if bits_per_sample != 16:
+    if bits_per_sample != _SUPPORTED_BPS:
         raise InvalidAudioFormat(
             f"Unsupported bits per sample: {bits_per_sample} (only 16-bit is supported)"
         )
 
-    if num_channels not in (1, 2):
+    if num_channels not in _VALID_CHANNELS:
         raise InvalidAudioFormat(
             f"Unsupported channel count: {num_channels} (only mono=1 or stereo=2)"
         )
 
-    if sample_rate not in (44100, 48000):
+    if sample_rate not in _VALID_RATES:
         raise InvalidAudioFormat(
             f"Unsupported sample rate: {sample_rate} Hz (only 44100 or 48000 supported)"
         )
@@ -152,13 +197,22 @@ def _parse_wav(f: BinaryIO) -> SoundData:
         avg_bytes_per_sec=byte_rate,
     )
 
-    # Calculate duration
-    num_frames = len(data_chunk) // format.frame_size
+    # Only now take the PCM: a copy for bytes, a view for a mapped file
+    data_offset, data_size = data_range
+    data_chunk = buf[data_offset : data_offset + data_size]
+
+    # Calculate duration from the validated fields (the header's block_align
+    # is not trusted and could be zero)
+    frame_size = (num_channels * bits_per_sample) >> 3
+    num_frames = len(data_chunk) // frame_size
     duration_seconds = num_frames / sample_rate
 
     logger.info(
-        f"Loaded WAV: {num_channels}ch, {sample_rate}Hz, {bits_per_sample}bit, "
-        f"{duration_seconds:.2f}s"
+        "Loaded WAV: %dch, %dHz, %dbit, %.2fs",
+        num_channels,
+        sample_rate,
+        bits_per_sample,
+        duration_seconds,
     )
 
     return SoundData(
@@ -74,13 +74,13 @@ class EngineLifecycleService:
             try:
                 self._worker.execute(self._backend.shutdown)
             except Exception as e:
-                logger.warning(f"Error during backend shutdown: {e}")
+                logger.warning("Error during backend shutdown: %s", e)
             
             # Stop worker thread
             try:
                 self._worker.stop()
             except Exception as e:
-                logger.warning(f"Error stopping worker thread: {e}")
+                logger.warning("Error stopping worker thread: %s", e)
             
             self._worker = None
         
@@ -1,18 +1,97 @@
 """Service for managing audio playback operations."""
 
+import itertools
+import threading
 import time
-import uuid
-from typing import Optional
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from xaudio2py.api.sound import PlaybackHandle, Sound
 from xaudio2py.core.exceptions import EngineNotStartedError, PlaybackNotFoundError
 from xaudio2py.core.interfaces import IBackendWorker, IVoice
 from xaudio2py.core.models import PlaybackState, VoiceParams
-from xaudio2py.core.registry import PlaybackRegistry
+from xaudio2py.core.registry import PlaybackInfo, PlaybackRegistry
 from xaudio2py.utils.log import get_logger
 from xaudio2py.utils.validate import validate_pan, validate_volume
 
 logger = get_logger(__name__)
 
+# Process-wide so handles stay unique across engine restarts.
+# next() on itertools.count is atomic under the GIL.
+_handle_ids = itertools.count(1)
+# XAudio2 operation sets used by PlaybackService.batch(); 0 means "apply now"
+_operation_sets = itertools.count(1)
+
+# (playback, "volume" | "pan", clamped value) queued inside a batch
+_BatchChange = Tuple[PlaybackInfo, str, float]
+
+
+def _release_voice(voice: IVoice) -> None:
+    """
+    Stop and destroy a voice (runs in the worker thread).
+
+    Playbacks leave the registry only after this returns, so a voice is never
+    dropped while the device can still call back into it.
+    """
+    voice.stop()
+    voice.destroy()
+
+
+def _apply_batch(
+    registry: PlaybackRegistry, operation_set: int, changes: List[_BatchChange]
+) -> None:
+    """
+    Apply queued changes as one operation set (runs in the worker thread).
+
+    Playbacks stopped since their change was queued are skipped: their voice
+    has been destroyed and must not be called into again.
+    """
+    changes = [change for change in changes if registry.get(change[0].handle) is change[0]]
+    voices = list(dict.fromkeys(info.voice for info, _, _ in changes))
+    for voice in voices:
+        voice.begin_batch(operation_set)
+    try:
+        for info, name, value in changes:
+            if name == "volume":
+                info.voice.set_volume(value)
+            else:
+                info.voice.set_pan(value)
+    finally:
+        # The first commit applies the whole set; later ones find nothing left
+        for voice in voices:
+            voice.end_batch()
+
+
+@dataclass(slots=True)
+class _VolumeRamp:
+    """Linear volume ramp evaluated by the worker loop (see BackendWorker.schedule)."""
+
+    handle_id: int
+    voice: IVoice
+    params: VoiceParams
+    start_volume: float
+    target: float
+    start_ns: int
+    end_ns: int
+    on_done: Callable[["_VolumeRamp"], None]
+    """Called once the target is reached (not when cancelled)."""
+    cancelled: bool = False
+
+    def __call__(self, now_ns: int) -> bool:
+        if self.cancelled:
+            return True
+        if now_ns >= self.end_ns:
+            volume = self.target
+        else:
+            t = (now_ns - self.start_ns) / (self.end_ns - self.start_ns)
+            volume = self.start_volume + (self.target - self.start_volume) * t
+        self.voice.set_volume(volume)
+        self.params.volume = volume
+        if volume != self.target:
+            return False
+        self.on_done(self)
+        return True
+
 
 class PlaybackService:
     """
@@ -42,10 +121,29 @@ class PlaybackService:
         self._worker = worker
         self._backend = backend
         self._registry = registry or PlaybackRegistry()
+        self._ramps: Dict[int, _VolumeRamp] = {}
+        # Ramps are added/cancelled by callers and finish in the worker
+        self._ramps_lock = threading.Lock()
+        # Per calling thread: .changes is a list while inside batch()
+        self._batch = threading.local()
+    
+    def _cancel_ramp(self, handle: PlaybackHandle) -> None:
+        """Cancel an active volume ramp for handle, if any."""
+        with self._ramps_lock:
+            ramp = self._ramps.pop(handle.id, None)
+        if ramp is not None:
+            ramp.cancelled = True
+    
+    def _ramp_done(self, ramp: _VolumeRamp) -> None:
+        """Forget a finished ramp (worker thread), unless already replaced."""
+        with self._ramps_lock:
+            if self._ramps.get(ramp.handle_id) is ramp:
+                del self._ramps[ramp.handle_id]
     
     def start_playback(
         self,
         sound: Sound,
+        *,
         volume: float = 1.0,
         pan: float = 0.0,
         loop: bool = False,
@@ -71,19 +169,18 @@ class PlaybackService:
         params = VoiceParams(volume=volume, pan=pan, loop=loop)
         
         # Create voice in worker thread
+        data = sound.data
         voice = self._worker.execute(
-            lambda: self._backend.create_source_voice(
-                sound.data.format, sound.data.data, params
-            )
+            self._backend.create_source_voice, data.format, data.data, params
         )
         
         # Create handle and register playback
-        handle_id = str(uuid.uuid4())
+        handle_id = next(_handle_ids)
         handle = PlaybackHandle(handle_id)
         
         self._registry.register(handle, voice, sound, params)
         
-        logger.debug(f"Started playback {handle_id}")
+        logger.debug("Started playback %s", handle_id)
         return handle
     
     def stop_playback(self, handle: PlaybackHandle) -> None:
@@ -101,9 +198,10 @@ class PlaybackService:
         if playback_info is None:
             raise PlaybackNotFoundError(f"Playback handle not found: {handle.id}")
         
-        self._worker.execute(playback_info.voice.stop)
+        self._cancel_ramp(handle)
+        self._worker.execute(_release_voice, playback_info.voice)
         self._registry.remove(handle)
-        logger.debug(f"Stopped playback {handle.id}")
+        logger.debug("Stopped playback %s", handle.id)
     
     def pause_playback(self, handle: PlaybackHandle) -> None:
         """
@@ -121,7 +219,7 @@ class PlaybackService:
             raise PlaybackNotFoundError(f"Playback handle not found: {handle.id}")
         
         self._worker.execute(playback_info.voice.pause)
-        logger.debug(f"Paused playback {handle.id}")
+        logger.debug("Paused playback %s", handle.id)
     
     def resume_playback(self, handle: PlaybackHandle) -> None:
         """
@@ -139,12 +237,14 @@ class PlaybackService:
             raise PlaybackNotFoundError(f"Playback handle not found: {handle.id}")
         
         self._worker.execute(playback_info.voice.resume)
-        logger.debug(f"Resumed playback {handle.id}")
+        logger.debug("Resumed playback %s", handle.id)
     
     def set_volume(self, handle: PlaybackHandle, volume: float) -> None:
         """
         Set volume for a playback.
         
+        Inside batch() the change is queued and applied when the batch exits.
+        
         Args:
             handle: Playback handle.
             volume: Volume (0.0 to 1.0).
@@ -158,14 +258,66 @@ class PlaybackService:
             raise PlaybackNotFoundError(f"Playback handle not found: {handle.id}")
         
         volume = validate_volume(volume)
-        self._worker.execute(lambda: playback_info.voice.set_volume(volume))
+        self._cancel_ramp(handle)
+        changes = getattr(self._batch, "changes", None)
+        if changes is not None:
+            changes.append((playback_info, "volume", volume))
+            return
+        self._worker.execute(playback_info.voice.set_volume, volume)
         playback_info.params.volume = volume
-        logger.debug(f"Set volume for playback {handle.id}: {volume}")
+        logger.debug("Set volume for playback %s: %s", handle.id, volume)
+    
+    def ramp_volume(
+        self, handle: PlaybackHandle, target: float, duration: float
+    ) -> None:
+        """
+        Fade volume linearly to target over duration seconds.
+        
+        The ramp is submitted as a single command and then evaluated by the
+        worker once per tick, instead of one set_volume() round-trip per step.
+        A later set_volume(), ramp_volume() or stop() cancels it.
+        
+        Args:
+            handle: Playback handle.
+            target: Target volume (0.0 to 1.0).
+            duration: Ramp duration in seconds.
+            
+        Raises:
+            EngineNotStartedError: If engine is not started.
+            PlaybackNotFoundError: If handle is invalid.
+        """
+        playback_info = self._registry.get(handle)
+        if playback_info is None:
+            raise PlaybackNotFoundError(f"Playback handle not found: {handle.id}")
+        
+        target = validate_volume(target)
+        if duration <= 0:
+            self.set_volume(handle, target)
+            return
+        
+        self._cancel_ramp(handle)
+        start_ns = time.monotonic_ns()
+        ramp = _VolumeRamp(
+            handle_id=handle.id,
+            voice=playback_info.voice,
+            params=playback_info.params,
+            start_volume=playback_info.params.volume,
+            target=target,
+            start_ns=start_ns,
+            end_ns=start_ns + int(duration * 1_000_000_000),
+            on_done=self._ramp_done,
+        )
+        with self._ramps_lock:
+            self._ramps[handle.id] = ramp
+        self._worker.execute(self._worker.schedule, ramp)
+        logger.debug("Ramping volume for playback %s to %s over %.3fs", handle.id, target, duration)
     
     def set_pan(self, handle: PlaybackHandle, pan: float) -> None:
         """
         Set pan for a playback.
         
+        Inside batch() the change is queued and applied when the batch exits.
+        
         Args:
             handle: Playback handle.
             pan: Pan (-1.0 left, 0.0 center, 1.0 right).
@@ -179,9 +331,45 @@ class PlaybackService:
             raise PlaybackNotFoundError(f"Playback handle not found: {handle.id}")
         
         pan = validate_pan(pan)
-        self._worker.execute(lambda: playback_info.voice.set_pan(pan))
+        changes = getattr(self._batch, "changes", None)
+        if changes is not None:
+            changes.append((playback_info, "pan", pan))
+            return
+        self._worker.execute(playback_info.voice.set_pan, pan)
         playback_info.params.pan = pan
-        logger.debug(f"Set pan for playback {handle.id}: {pan}")
+        logger.debug("Set pan for playback %s: %s", handle.id, pan)
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group set_volume/set_pan calls made by this thread into one update.
+        
+        The changes are sent to the worker as a single command when the block
+        exits and applied in the same audio processing pass (one XAudio2
+        operation set and CommitChanges). They are discarded if the block
+        raises. Nested batches join the outermost one.
+        
+        Example:
+            with service.batch():
+                service.set_volume(music, 0.2)
+                service.set_pan(effect, -1.0)
+        """
+        if getattr(self._batch, "changes", None) is not None:
+            yield
+            return
+        changes: List[_BatchChange] = []
+        self._batch.changes = changes
+        try:
+            yield
+        finally:
+            self._batch.changes = None
+        if not changes:
+            return
+        operation_set = next(_operation_sets)
+        self._worker.execute(_apply_batch, self._registry, operation_set, changes)
+        for info, name, value in changes:
+            setattr(info.params, name, value)
+        logger.debug("Committed %d changes as operation set %d", len(changes), operation_set)
     
     def is_playing(self, handle: PlaybackHandle) -> bool:
         """
@@ -198,24 +386,35 @@ class PlaybackService:
         """
         playback_info = self._registry.get(handle)
         if playback_info is None:
-            logger.debug(f"is_playing: handle {handle.id} not found")
+            logger.debug("is_playing: handle %s not found", handle.id)
             return False
         
-        # Get state from voice
-        state = self._worker.execute(playback_info.voice.get_state)
+        # Read the callback-maintained state directly: no worker round-trip
+        return playback_info.voice.state is PlaybackState.PLAYING
+    
+    def wait(self, handle: PlaybackHandle, timeout: Optional[float] = None) -> bool:
+        """
+        Block until playback finishes or is stopped.
         
-        elapsed = time.monotonic() - playback_info.start_time
+        Waits on the voice's completion event in the calling thread, so the
+        worker stays free to serve other commands meanwhile.
         
-        # Check time-based completion for non-looping sounds
-        if state == PlaybackState.PLAYING and not playback_info.params.loop:
-            if elapsed >= playback_info.sound.duration:
-                logger.debug(
-                    f"is_playing: playback completed "
-                    f"(duration {elapsed:.3f}s >= {playback_info.sound.duration:.3f}s)"
-                )
-                return False
+        Args:
+            handle: Playback handle.
+            timeout: Maximum time to wait in seconds (None waits forever).
+            
+        Returns:
+            True if playback finished (or the handle is unknown),
+            False if the timeout expired.
+            
+        Raises:
+            EngineNotStartedError: If engine is not started.
+        """
+        playback_info = self._registry.get(handle)
+        if playback_info is None:
+            return True
         
-        return state == PlaybackState.PLAYING
+        return playback_info.voice.wait(timeout)
     
     def stop_all(self) -> None:
         """
@@ -224,12 +423,35 @@ class PlaybackService:
         Raises:
             EngineNotStartedError: If engine is not started.
         """
-        handles = self._registry.get_all_handles()
-        for handle in handles:
+        infos = self._registry.get_all_infos()
+        for playback_info in infos:
+            self._cancel_ramp(playback_info.handle)
+        
+        # One worker round-trip for every voice instead of one per voice
+        stopped = self._worker.execute(self._stop_voices, infos)
+        for handle in stopped:
+            self._registry.remove(handle)
+    
+    @staticmethod
+    def _stop_voices(infos: list[PlaybackInfo]) -> list[PlaybackHandle]:
+        """
+        Stop and destroy each voice in turn (runs in the worker thread).
+        
+        A failing voice is logged and left registered; the rest still stop.
+        
+        Returns:
+            Handles whose voices were stopped.
+        """
+        stopped = []
+        for playback_info in infos:
+            handle = playback_info.handle
             try:
-                self.stop_playback(handle)
+                _release_voice(playback_info.voice)
             except Exception as e:
-                logger.warning(f"Error stopping playback {handle.id}: {e}")
+                logger.warning("Error stopping playback %s: %s", handle.id, e)
+                continue
+            stopped.append(handle)
+        return stopped
     
     @property
     def registry(self) -> PlaybackRegistry:
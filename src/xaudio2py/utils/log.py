@@ -1,24 +1,31 @@
 """Logging configuration."""
 
 import logging
+import threading
 from typing import Dict
 
 _loggers: Dict[str, logging.Logger] = {}
+_loggers_lock = threading.Lock()
+
+# Shared by every handler created here
+_FORMATTER = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
 
 def get_logger(name: str) -> logging.Logger:
     """Get or create a logger for the given name."""
-    if name not in _loggers:
-        logger = logging.getLogger(name)
-        logger.setLevel(logging.WARNING)  # Only show warnings and errors
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            handler.setFormatter(
-                logging.Formatter(
-                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-                )
-            )
-            logger.addHandler(handler)
-        _loggers[name] = logger
-    return _loggers[name]
+    logger = _loggers.get(name)
+    if logger is not None:
+        return logger
 
+    # Configure under a lock so concurrent first calls add only one handler
+    with _loggers_lock:
+        logger = _loggers.get(name)
+        if logger is None:
+            logger = logging.getLogger(name)
+            logger.setLevel(logging.WARNING)  # Only show warnings and errors
+            if not logger.handlers:
+                handler = logging.StreamHandler()
+                handler.setFormatter(_FORMATTER)
+                logger.addHandler(handler)
+            _loggers[name] = logger
+    return logger
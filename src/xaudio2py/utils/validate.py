@@ -1,20 +1,17 @@
 """Validation utilities."""
 
 
+def clamp(value: float, min_val: float, max_val: float) -> float:
+    """Clamp value to range [min_val, max_val]."""
+    # Plain comparisons: min()/max() builtin calls are several times slower
+    return min_val if value < min_val else (max_val if value > max_val else value)
+
+
 def validate_volume(volume: float) -> float:
     """Validate and clamp volume to [0.0, 1.0]."""
-    if volume < 0.0:
-        return 0.0
-    if volume > 1.0:
-        return 1.0
-    return volume
+    return clamp(volume, 0.0, 1.0)
 
 
 def validate_pan(pan: float) -> float:
     """Validate and clamp pan to [-1.0, 1.0]."""
-    if pan < -1.0:
-        return -1.0
-    if pan > 1.0:
-        return 1.0
-    return pan
-
+    return clamp(pan, -1.0, 1.0)
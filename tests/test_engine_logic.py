@@ -179,6 +179,23 @@ def test_is_playing():
     assert not engine.is_playing(handle)
 
 
+def test_null_voice_state_is_read_only():
+    """Test that NullVoice.state reports completion without mutating the voice."""
+    backend = NullBackend()
+    engine = AudioEngine(backend=backend)
+    engine.start()
+
+    handle = engine.play(create_test_sound())
+    voice = engine._playback_service.registry.get(handle).voice
+    time.sleep(0.15)
+
+    assert voice.state is PlaybackState.STOPPED
+    assert voice._state is PlaybackState.PLAYING
+    assert voice._total_played_ns == 0
+
+    engine.shutdown()
+
+
 def test_volume_validation():
     """Test volume validation (clamping)."""
     backend = NullBackend()
@@ -203,3 +220,325 @@ def test_pan_validation():
 
     engine.set_pan(handle, -2.0)  # Should be clamped to -1.0
     engine.stop(handle)
+
+
+def test_play_after_shutdown():
+    """Test that play raises error again once the engine is shut down."""
+    backend = NullBackend()
+    engine = AudioEngine(backend=backend)
+    engine.start()
+    engine.shutdown()
+    sound = create_test_sound()
+
+    with pytest.raises(EngineNotStarted):
+        engine.play(sound)
+
+    with pytest.raises(EngineNotStarted):
+        engine.is_playing(None)
+
+
+def test_playback_handle_is_hashable():
+    """Test that handles can be used as dict keys and compare by id."""
+    from xaudio2py.api.sound import PlaybackHandle
+
+    handle = PlaybackHandle(1)
+    assert handle == PlaybackHandle(1)
+    assert {handle: "sfx"}[PlaybackHandle(1)] == "sfx"
+    assert not hasattr(handle, "__dict__")
+
+
+def test_wait():
+    """Test waiting for playback completion."""
+    backend = NullBackend()
+    engine = AudioEngine(backend=backend)
+    engine.start()
+
+    sound = create_test_sound()
+    handle = engine.play(sound)
+    assert engine.wait(handle, timeout=1.0)
+    assert not engine.is_playing(handle)
+
+    # Looping playback only finishes when stopped
+    handle = engine.play(sound, loop=True)
+    assert not engine.wait(handle, timeout=0.05)
+    engine.stop(handle)
+    assert engine.wait(handle, timeout=0.05)
+
+    engine.shutdown()
+
+
+def test_ramp_volume():
+    """Test volume ramp evaluated by the worker."""
+    backend = NullBackend()
+    engine = AudioEngine(backend=backend)
+    engine.start()
+
+    sound = create_test_sound()
+    handle = engine.play(sound, volume=1.0, loop=True)
+    voice = engine._playback_service.registry.get(handle).voice
+
+    engine.ramp_volume(handle, 0.0, 0.05)
+    deadline = time.monotonic() + 1.0
+    while voice.params.volume != 0.0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert voice.params.volume == 0.0
+
+    # A finished ramp is forgotten by the service
+    ramps = engine._playback_service._ramps
+    deadline = time.monotonic() + 1.0
+    while ramps and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert handle.id not in ramps
+
+    # set_volume cancels a running ramp
+    engine.ramp_volume(handle, 1.0, 10.0)
+    engine.set_volume(handle, 0.3)
+    time.sleep(0.05)
+    assert voice.params.volume == 0.3
+
+    engine.stop(handle)
+    engine.shutdown()
+
+
+def test_engine_config_is_immutable():
+    """Test that the shared default config cannot be mutated."""
+    import dataclasses
+
+    config = EngineConfig()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.sample_rate = 44100
+
+    assert AudioEngine(backend=NullBackend())._config == config
+
+
+def test_is_playing_after_pause_resume():
+    """Test that paused time does not count towards completion."""
+    backend = NullBackend()
+    engine = AudioEngine(backend=backend)
+    engine.start()
+
+    sound = create_test_sound()  # ~57 ms of audio
+    handle = engine.play(sound)
+    voice = engine._playback_service.registry.get(handle).voice
+
+    engine.pause(handle)
+    samples_played, buffers_queued = voice.get_progress()
+    assert buffers_queued == 1
+    time.sleep(0.1)
+    assert voice.get_progress() == (samples_played, 1)
+
+    engine.resume(handle)
+    assert engine.is_playing(handle)
+
+    assert engine.wait(handle, timeout=1.0)
+    assert not engine.is_playing(handle)
+    assert voice.get_progress()[1] == 0
+
+    engine.shutdown()
+
+
+def test_stop_all():
+    """Test stopping every active playback at once."""
+    backend = NullBackend()
+    engine = AudioEngine(backend=backend)
+    engine.start()
+
+    sound = create_test_sound()
+    handles = [engine.play(sound, loop=True) for _ in range(3)]
+    service = engine._playback_service
+    assert set(service.registry.iter_handles()) == set(handles)
+    assert len(list(service.registry.iter_voices())) == 3
+
+    service.stop_all()
+    assert service.registry.count() == 0
+    assert not any(engine.is_playing(h) for h in handles)
+
+    engine.shutdown()
+
+
+def test_stop_all_isolates_failing_voice(monkeypatch):
+    """A voice whose stop() fails stays registered; the others stop."""
+    from xaudio2py.backends.null_backend import NullVoice
+
+    engine = AudioEngine(backend=NullBackend())
+    engine.start()
+
+    sound = create_test_sound()
+    handles = [engine.play(sound, loop=True) for _ in range(3)]
+    service = engine._playback_service
+    bad = service.registry.get(handles[1]).voice
+    real_stop = NullVoice.stop
+
+    def stop(self):
+        if self is bad:
+            raise RuntimeError("device lost")
+        real_stop(self)
+
+    monkeypatch.setattr(NullVoice, "stop", stop)
+    service.stop_all()
+
+    assert service.registry.count() == 1
+    assert service.registry.get(handles[1]) is not None
+    assert not engine.is_playing(handles[0])
+
+    monkeypatch.undo()
+    engine.shutdown()
+
+
+def test_registry_iteration_during_mutation():
+    """Iterating the registry survives concurrent register/remove."""
+    from xaudio2py.api.sound import PlaybackHandle
+    from xaudio2py.core.models import VoiceParams
+    from xaudio2py.core.registry import PlaybackRegistry
+
+    registry = PlaybackRegistry()
+    sound = create_test_sound()
+    for i in range(10):
+        registry.register(PlaybackHandle(i), None, sound, VoiceParams())
+
+    seen = 0
+    for handle in registry.iter_handles():
+        registry.remove(handle)
+        registry.register(PlaybackHandle(handle.id + 100), None, sound, VoiceParams())
+        seen += 1
+
+    assert seen == 10
+    assert registry.count() == 10
+
+
+def test_play_signature_same_before_and_after_start():
+    """play() takes volume/pan/loop keyword-only whether or not started."""
+    engine = AudioEngine(backend=NullBackend())
+    sound = create_test_sound()
+
+    with pytest.raises(TypeError):
+        engine.play(sound, 0.5)
+
+    engine.start()
+    with pytest.raises(TypeError):
+        engine.play(sound, 0.5)
+    handle = engine.play(sound, volume=0.5, pan=-0.5)
+    assert engine.is_playing(handle)
+
+    engine.shutdown()
+
+
+def test_stopped_voices_are_destroyed(monkeypatch):
+    """stop() and stop_all() destroy voices before dropping them."""
+    from xaudio2py.backends.null_backend import NullVoice
+
+    destroyed = []
+    real_destroy = NullVoice.destroy
+
+    def destroy(self):
+        destroyed.append(self.voice_id)
+        real_destroy(self)
+
+    monkeypatch.setattr(NullVoice, "destroy", destroy)
+    engine = AudioEngine(backend=NullBackend())
+    engine.start()
+
+    sound = create_test_sound()
+    first = engine.play(sound, loop=True)
+    engine.play(sound, loop=True)
+    engine.stop(first)
+    assert destroyed == [0]
+
+    engine._playback_service.stop_all()
+    assert destroyed == [0, 1]
+
+    engine.shutdown()
+
+
+def test_batch_applies_changes_in_one_operation_set(monkeypatch):
+    """Changes inside batch() are deferred and applied under one operation set."""
+    from xaudio2py.backends.null_backend import NullVoice
+
+    applied = []
+    real_set_volume = NullVoice.set_volume
+    real_set_pan = NullVoice.set_pan
+
+    def set_volume(self, volume):
+        applied.append((self.voice_id, "volume", self._operation_set))
+        real_set_volume(self, volume)
+
+    def set_pan(self, pan):
+        applied.append((self.voice_id, "pan", self._operation_set))
+        real_set_pan(self, pan)
+
+    monkeypatch.setattr(NullVoice, "set_volume", set_volume)
+    monkeypatch.setattr(NullVoice, "set_pan", set_pan)
+    engine = AudioEngine(backend=NullBackend())
+    engine.start()
+
+    sound = create_test_sound()
+    first = engine.play(sound, loop=True)
+    second = engine.play(sound, loop=True)
+    registry = engine._playback_service.registry
+    applied.clear()
+
+    with engine.batch():
+        engine.set_volume(first, 0.2)
+        with engine.batch():
+            engine.set_pan(second, 2.0)
+        assert applied == []
+        assert registry.get(first).params.volume == 1.0
+
+    assert [name for _, name, _ in applied] == ["volume", "pan"]
+    operation_sets = {op for _, _, op in applied}
+    assert len(operation_sets) == 1 and 0 not in operation_sets
+    assert registry.get(first).params.volume == 0.2
+    assert registry.get(second).params.pan == 1.0
+    assert registry.get(first).voice._operation_set == 0
+
+    # A failing block discards its changes
+    applied.clear()
+    with pytest.raises(RuntimeError):
+        with engine.batch():
+            engine.set_volume(first, 0.7)
+            raise RuntimeError("boom")
+    assert applied == []
+    assert registry.get(first).params.volume == 0.2
+
+    engine.shutdown()
+    with pytest.raises(EngineNotStarted):
+        engine.batch()
+
+
+def test_batch_skips_playback_stopped_inside_block(monkeypatch):
+    """A playback stopped inside batch() is not touched when the batch exits."""
+    from xaudio2py.backends.null_backend import NullVoice
+
+    touched = []
+    real_begin_batch = NullVoice.begin_batch
+    real_set_volume = NullVoice.set_volume
+
+    def begin_batch(self, operation_set):
+        touched.append(("begin", self.voice_id))
+        real_begin_batch(self, operation_set)
+
+    def set_volume(self, volume):
+        touched.append(("volume", self.voice_id))
+        real_set_volume(self, volume)
+
+    monkeypatch.setattr(NullVoice, "begin_batch", begin_batch)
+    monkeypatch.setattr(NullVoice, "set_volume", set_volume)
+    engine = AudioEngine(backend=NullBackend())
+    engine.start()
+
+    sound = create_test_sound()
+    stopped = engine.play(sound, loop=True)
+    kept = engine.play(sound, loop=True)
+    registry = engine._playback_service.registry
+    kept_id = registry.get(kept).voice.voice_id
+    touched.clear()
+
+    with engine.batch():
+        engine.set_volume(stopped, 0.1)
+        engine.set_volume(kept, 0.4)
+        engine.stop(stopped)
+
+    assert touched == [("begin", kept_id), ("volume", kept_id)]
+    assert registry.get(kept).params.volume == 0.4
+
+    engine.shutdown()
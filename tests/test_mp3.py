@@ -0,0 +1,128 @@
+"""Tests for MP3 loading and the decoded-PCM cache."""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+from xaudio2py.core.exceptions import InvalidAudioFormat
+from xaudio2py.formats import load_audio, mp3
+
+
+@pytest.fixture
+def fake_pydub(monkeypatch):
+    """Replace the decoder with one that records calls; returns the call list."""
+    monkeypatch.setattr(mp3, "_import_miniaudio", lambda: None)
+    monkeypatch.delenv(mp3._CACHE_ENV, raising=False)
+    monkeypatch.delenv(mp3._CACHE_MAX_ENV, raising=False)
+    calls = []
+
+    def fake_decode(self, path):
+        calls.append(path)
+        return mp3._make_sound_data(b"\x01\x02" * 4800, 1, 48000, 0.1)
+
+    monkeypatch.setattr(mp3.Mp3Format, "_load_pydub", fake_decode)
+    return calls
+
+
+def test_mp3_cache_disabled_by_default(tmp_path, fake_pydub):
+    """Without XAUDIO2PY_MP3_CACHE every load decodes and nothing is written."""
+    source = tmp_path / "track.mp3"
+    source.write_bytes(b"not really mp3")
+
+    mp3.mp3_format.load(str(source))
+    mp3.mp3_format.load(str(source))
+
+    assert len(fake_pydub) == 2
+    assert mp3._cache_dir() is None
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["track.mp3"]
+
+
+def test_mp3_decode_cache(tmp_path, monkeypatch, fake_pydub):
+    """Second load of an unchanged MP3 is served from the disk cache."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(mp3._CACHE_ENV, str(cache_dir))
+    source = tmp_path / "track.mp3"
+    source.write_bytes(b"not really mp3")
+
+    first = mp3.mp3_format.load(str(source))
+    second = mp3.mp3_format.load(str(source))
+
+    assert len(fake_pydub) == 1
+    # Cache hits are memory-mapped, exposed like large WAV files
+    assert isinstance(second.data, memoryview)
+    assert second.format == first.format
+    assert bytes(second.data) == first.data
+    assert second.duration_seconds == pytest.approx(0.1)
+    assert len(list(cache_dir.glob("*.pcm"))) == 1
+
+    with pytest.raises(FileNotFoundError):
+        load_audio(str(tmp_path / "missing.mp3"))
+
+
+def test_mp3_cache_evicts_least_recently_used(tmp_path, monkeypatch, fake_pydub):
+    """Entries beyond XAUDIO2PY_MP3_CACHE_MAX_MB are evicted oldest first."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(mp3._CACHE_ENV, str(cache_dir))
+    # Room for two 9600-byte entries, not three
+    monkeypatch.setenv(mp3._CACHE_MAX_ENV, str(20000 / (1024 * 1024)))
+    paths = []
+    for name in ("a.mp3", "b.mp3", "c.mp3"):
+        source = tmp_path / name
+        source.write_bytes(name.encode())
+        paths.append(str(source))
+
+    keys = [mp3._cache_key(path, os.stat(path)) for path in paths]
+
+    mp3.mp3_format.load(paths[0])
+    mp3.mp3_format.load(paths[1])
+    # Age a.mp3's entry, then a cache hit makes it the most recently used
+    os.utime(cache_dir / f"{keys[0]}.pcm", ns=(1, 1))
+    os.utime(cache_dir / f"{keys[1]}.pcm", ns=(2, 2))
+    mp3.mp3_format.load(paths[0])
+    mp3.mp3_format.load(paths[2])
+
+    assert len(fake_pydub) == 3
+    assert sorted(p.stem for p in cache_dir.glob("*.pcm")) == sorted([keys[0], keys[2]])
+    assert not (cache_dir / f"{keys[1]}.json").exists()
+
+
+def test_mp3_load_miniaudio(tmp_path, monkeypatch):
+    """miniaudio is preferred and decodes to a supported rate in-process."""
+    monkeypatch.delenv(mp3._CACHE_ENV, raising=False)
+    requested = {}
+
+    class MiniaudioError(Exception):
+        pass
+
+    def decode_file(path, output_format, nchannels, sample_rate):
+        requested.update(format=output_format, nchannels=nchannels, sample_rate=sample_rate)
+        if path.endswith("bad.mp3"):
+            raise MiniaudioError("corrupt frame")
+        samples = SimpleNamespace(tobytes=lambda: b"\x00\x00" * nchannels * 4410)
+        return SimpleNamespace(
+            samples=samples, nchannels=nchannels, sample_rate=sample_rate, num_frames=4410
+        )
+
+    fake_miniaudio = SimpleNamespace(
+        mp3_get_file_info=lambda path: SimpleNamespace(nchannels=6, sample_rate=22050),
+        decode_file=decode_file,
+        SampleFormat=SimpleNamespace(SIGNED16="s16"),
+        MiniaudioError=MiniaudioError,
+    )
+    monkeypatch.setattr(mp3, "_import_miniaudio", lambda: fake_miniaudio)
+
+    source = tmp_path / "track.mp3"
+    source.write_bytes(b"not really mp3")
+    sound = load_audio(str(source))
+
+    assert requested == {"format": "s16", "nchannels": 2, "sample_rate": 44100}
+    assert sound.format.channels == 2
+    assert sound.format.sample_rate == 44100
+    assert sound.format.block_align == 4
+    assert len(sound.data) == 4 * 4410
+    assert sound.duration_seconds == pytest.approx(0.1)
+
+    bad = tmp_path / "bad.mp3"
+    bad.write_bytes(b"")
+    with pytest.raises(InvalidAudioFormat):
+        load_audio(str(bad))
@@ -71,6 +71,43 @@ def test_worker_execute_timeout():
     worker.stop()
 
 
+def test_worker_execute_after_timeout():
+    """Test that a timed-out command does not complete the caller's next one."""
+    backend = NullBackend()
+    worker = BackendWorker(backend)
+
+    worker.start()
+
+    release = threading.Event()
+
+    def slow_function():
+        release.wait()
+        return "stale"
+
+    with pytest.raises(TimeoutError):
+        worker.execute(slow_function, timeout=0.05)
+
+    # Queued behind slow_function, whose completion must not wake this call
+    threading.Timer(0.05, release.set).start()
+    assert worker.execute(lambda: time.sleep(0.1) or "fresh", timeout=2.0) == "fresh"
+    worker.stop()
+
+
+def test_worker_nested_execute():
+    """Test that execute() from the worker thread runs inline."""
+    backend = NullBackend()
+    worker = BackendWorker(backend)
+
+    worker.start()
+
+    def outer():
+        return worker.execute(threading.current_thread) is worker._thread
+
+    assert worker.execute(outer, timeout=1.0)
+
+    worker.stop()
+
+
 def test_worker_not_initialized():
     """Test executing before worker is started."""
     backend = NullBackend()
@@ -115,3 +152,18 @@ def test_concurrent_executions():
 
     worker.stop()
 
+
+
+def test_worker_execute_with_args():
+    """Test passing positional arguments through execute."""
+    backend = NullBackend()
+    worker = BackendWorker(backend)
+
+    worker.start()
+
+    assert worker.execute(divmod, 7, 2) == (3, 1)
+
+    worker.execute(backend.set_master_volume, 0.25)
+    assert backend._master_volume == 0.25
+
+    worker.stop()
@@ -74,6 +74,20 @@ def test_parse_mono_wav():
     assert sound_data.format.sample_rate == 48000
 
 
+def test_parse_chunks_out_of_order():
+    """fmt after data, and odd-sized chunks, are handled."""
+    wav = create_test_wav(num_samples=10)
+    fmt_chunk = wav[12:36]
+    data_chunk = wav[36:]
+    odd_chunk = b"LIST" + struct.pack("<I", 3) + b"abc\x00"
+    body = b"WAVE" + odd_chunk + data_chunk + fmt_chunk
+    wav_file = io.BytesIO(b"RIFF" + struct.pack("<I", len(body)) + body)
+
+    sound_data = _parse_wav(wav_file)
+    assert sound_data.format.channels == 2
+    assert sound_data.data == data_chunk[8:]
+
+
 def test_parse_invalid_format():
     """Test parsing a WAV with unsupported format."""
     wav_data = create_test_wav()
@@ -118,8 +132,64 @@ def test_load_wav_from_file():
         Path(temp_path).unlink()
 
 
+def test_load_large_wav_is_memory_mapped(tmp_path):
+    """Large WAVs are served as a writable view instead of a bytes copy."""
+    import ctypes
+
+    path = tmp_path / "long.wav"
+    path.write_bytes(create_test_wav(num_samples=48000))
+
+    sound_data = load_audio(str(path))
+    assert isinstance(sound_data.data, memoryview)
+    assert len(sound_data.data) == 48000 * 4
+    assert sound_data.num_frames == 48000
+    # The backend wraps writable buffers without copying
+    (ctypes.c_uint8 * len(sound_data.data)).from_buffer(sound_data.data)
+
+
+def test_close_releases_memory_mapped_wav(tmp_path):
+    """close() unmaps large WAV data unless a voice buffer still pins it."""
+    import ctypes
+
+    path = tmp_path / "long.wav"
+    path.write_bytes(create_test_wav(num_samples=48000))
+
+    sound_data = load_audio(str(path))
+    mapped = sound_data.data.obj
+    sound_data.close()
+    assert mapped.closed
+    sound_data.close()  # Idempotent
+
+    # A backend buffer still points into the mapping: it stays valid
+    sound_data = load_audio(str(path))
+    mapped = sound_data.data.obj
+    in_use = (ctypes.c_uint8 * len(sound_data.data)).from_buffer(sound_data.data)
+    sound_data.close()
+    assert not mapped.closed
+    assert in_use[0] == 0
+
+    # In-memory data has nothing to release
+    small = wav_format.load_bytes(create_test_wav())
+    small.close()
+    assert isinstance(small.data, bytes)
+
+
 def test_load_wav_file_not_found():
     """Test loading non-existent WAV file."""
     with pytest.raises(FileNotFoundError):
         wav_format.load("nonexistent.wav")
 
+
+
+def test_load_wav_bytes():
+    """Test loading a WAV that was already read into memory."""
+    from xaudio2py.api.engine import AudioEngine
+    from xaudio2py.backends.null_backend import NullBackend
+
+    wav_data = create_test_wav(sample_rate=48000, channels=1, num_samples=480)
+    sound = AudioEngine(backend=NullBackend()).load_wav_bytes(wav_data, "sfx.wav")
+
+    assert sound.path == "sfx.wav"
+    assert sound.data.format.sample_rate == 48000
+    assert sound.duration == pytest.approx(0.01)
+
@@ -0,0 +1,81 @@
+"""Tests for platform-independent XAudio2 backend helpers."""
+
+import pytest
+from xaudio2py.backends.xaudio2.utils import clamp, hrcheck, pan_to_matrix
+from xaudio2py.core.exceptions import BackendError
+
+
+def test_clamp():
+    """Test clamping to a range."""
+    assert clamp(2.0, 0.0, 1.0) == 1.0
+    assert clamp(-2.0, 0.0, 1.0) == 0.0
+    assert clamp(0.25, 0.0, 1.0) == 0.25
+
+
+def test_hrcheck():
+    """Test HRESULT checking for unsigned and signed failure codes."""
+    hrcheck(0)
+    hrcheck(1)  # S_FALSE
+
+    for hresult in (0x88960001, 0x88960001 - 0x100000000):
+        with pytest.raises(BackendError) as exc_info:
+            hrcheck(hresult, "Call failed")
+        assert exc_info.value.hresult == 0x88960001 - 0x100000000
+        assert "0x88960001" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "pan, expected",
+    [
+        (-1.0, [1.0, 0.0, 0.0, 0.0]),
+        (-0.5, [1.0, 0.0, 0.0, 0.5]),
+        (0.0, [1.0, 0.0, 0.0, 1.0]),
+        (0.5, [0.5, 0.0, 0.0, 1.0]),
+        (1.0, [0.0, 0.0, 0.0, 1.0]),
+        (5.0, [0.0, 0.0, 0.0, 1.0]),  # Clamped
+    ],
+)
+def test_pan_to_matrix_stereo(pan, expected):
+    """Test stereo pan matrix coefficients."""
+    assert pan_to_matrix(pan, 2) == expected
+
+
+def test_pan_to_matrix_mono_source():
+    """Test that a mono source gets one level per output channel."""
+    assert pan_to_matrix(0.0, 2, 1) == [1.0, 1.0]
+    assert pan_to_matrix(0.5, 2, 1) == [0.5, 1.0]
+    assert pan_to_matrix(-1.0, 2, 1) == [1.0, 0.0]
+
+
+def test_ixaudio2_vtbl_release_slot():
+    """Test that Release resolves to the IUnknown slot (index 2)."""
+    from ctypes import sizeof, c_void_p
+    from xaudio2py.backends.xaudio2.interfaces import IXAudio2Vtbl
+
+    assert IXAudio2Vtbl.Release.offset == 2 * sizeof(c_void_p)
+
+
+def test_create_waveformatex_returns_fresh_struct():
+    """Test cached WAVEFORMATEX templates are copied per call."""
+    from xaudio2py.backends.xaudio2.bindings import create_waveformatex
+
+    a = create_waveformatex(44100, 2, 16)
+    b = create_waveformatex(44100, 2, 16)
+    assert a is not b
+    assert (a.nBlockAlign, a.nAvgBytesPerSec) == (4, 176400)
+
+    a.nChannels = 1
+    assert b.nChannels == 2
+
+
+def test_voice_state_struct_layout():
+    """Test that VOICE_STATE_STRUCT matches the ctypes structure layout."""
+    from ctypes import sizeof
+    from xaudio2py.backends.xaudio2.bindings import (
+        VOICE_STATE_STRUCT,
+        XAUDIO2_VOICE_STATE,
+    )
+
+    state = XAUDIO2_VOICE_STATE(BuffersQueued=3, SamplesPlayed=2**40 + 7)
+    assert VOICE_STATE_STRUCT.size == sizeof(XAUDIO2_VOICE_STATE)
+    assert VOICE_STATE_STRUCT.unpack_from(state) == (0, 3, 2**40 + 7)